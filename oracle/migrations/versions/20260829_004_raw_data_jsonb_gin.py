@@ -0,0 +1,40 @@
+"""raw_data to JSONB with GIN index and LZ4 TOAST compression
+
+Revision ID: 20260829_004
+Revises: 20260109_003
+Create Date: 2026-08-29 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20260829_004'
+down_revision: Union[str, None] = '20260109_003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. Ensure raw_data is JSONB (no-op on fresh installs created from JSONB schema,
+    #    converts legacy json columns created by metadata.create_all)
+    op.execute("ALTER TABLE alerts ALTER COLUMN raw_data TYPE jsonb USING raw_data::jsonb")
+
+    # 2. GIN index for containment queries (e.g. raw_data @> '{"src_ip": ...}')
+    #    jsonb_path_ops is smaller and faster than the default opclass for @> lookups
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_raw_data_gin "
+        "ON alerts USING GIN (raw_data jsonb_path_ops)"
+    )
+
+    # 3. TOAST tuning: compress large raw_data payloads aggressively with LZ4 (Postgres 14+)
+    op.execute("ALTER TABLE alerts SET (toast_tuple_target = 128)")
+    op.execute("DO $$ BEGIN ALTER TABLE alerts ALTER COLUMN raw_data SET COMPRESSION lz4; EXCEPTION WHEN OTHERS THEN NULL; END $$;")
+
+
+def downgrade() -> None:
+    op.execute("DO $$ BEGIN ALTER TABLE alerts ALTER COLUMN raw_data SET COMPRESSION pglz; EXCEPTION WHEN OTHERS THEN NULL; END $$;")
+    op.execute("ALTER TABLE alerts RESET (toast_tuple_target)")
+    op.execute("DROP INDEX IF EXISTS idx_raw_data_gin")
+    op.execute("ALTER TABLE alerts ALTER COLUMN raw_data TYPE json USING raw_data::json")
@@ -0,0 +1,138 @@
+"""partition alerts by timestamp range
+
+Revision ID: 20260829_005
+Revises: 20260829_004
+Create Date: 2026-08-29 10:30:00.000000
+
+Converts `alerts` to a declarative range-partitioned table (monthly) so the
+`timestamp >= start_time` predicate used by the stats/analytics queries only
+touches the hot partitions instead of scanning all history. No SQLAlchemy
+model change is required - the ORM is unaware of partitioning.
+
+Note: the threat_intelligence.alert_id foreign key is dropped here and only
+restored on downgrade. A partitioned table cannot carry a unique constraint
+on id alone (every unique index must include the partition key), so there is
+nothing for the FK to reference; alert_id remains as a plain integer column.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20260829_005'
+down_revision: Union[str, None] = '20260829_004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Secondary indexes recreated on the partitioned parent (cascading to every
+# partition). LIKE ... INCLUDING INDEXES cannot be used: it would copy the
+# original PRIMARY KEY (id) - clashing with the composite PK the partitioned
+# table needs, and invalid anyway since a unique index on a partitioned table
+# must include the partition key.
+_ALERT_INDEXES = (
+    "CREATE INDEX ix_alerts_source ON alerts (source)",
+    "CREATE INDEX ix_alerts_alert_type ON alerts (alert_type)",
+    "CREATE INDEX ix_alerts_severity ON alerts (severity)",
+    "CREATE INDEX ix_alerts_timestamp ON alerts (timestamp)",
+    "CREATE INDEX idx_alerts_timestamp_severity ON alerts (timestamp, severity)",
+    "CREATE INDEX idx_alerts_source_type ON alerts (source, alert_type)",
+    "CREATE INDEX idx_alerts_threat_score ON alerts (threat_score)",
+    "CREATE INDEX idx_raw_data_gin ON alerts USING GIN (raw_data jsonb_path_ops)",
+)
+
+
+def upgrade() -> None:
+    # 1. Recreate alerts as a partitioned table. Partitioned tables require the
+    #    partition key in the primary key, so the PK becomes (id, timestamp).
+    #    Only defaults are copied from the old table; indexes are recreated
+    #    explicitly after the swap (see _ALERT_INDEXES).
+    op.execute("""
+        CREATE TABLE alerts_partitioned (
+            LIKE alerts INCLUDING DEFAULTS,
+            PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp);
+    """)
+
+    # 2. Seed monthly partitions around "now" plus a default catch-all for
+    #    anything outside the seeded window (pg_partman or a cron job should
+    #    take over partition maintenance in production).
+    op.execute("""
+        DO $$
+        DECLARE
+            start_month date := date_trunc('month', now() - interval '3 months')::date;
+            m date;
+        BEGIN
+            FOR i IN 0..6 LOOP
+                m := start_month + (i || ' months')::interval;
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS alerts_%s PARTITION OF alerts_partitioned
+                     FOR VALUES FROM (%L) TO (%L)',
+                    to_char(m, 'YYYY_MM'), m, m + interval '1 month'
+                );
+            END LOOP;
+        END $$;
+    """)
+    op.execute("CREATE TABLE alerts_default PARTITION OF alerts_partitioned DEFAULT")
+
+    # 3. Drop the threat_intelligence FK explicitly before the swap. The
+    #    partitioned table has no unique constraint on id alone, so this FK
+    #    cannot be recreated against it; dropping it here (instead of letting
+    #    DROP ... CASCADE take it silently) makes the loss part of the
+    #    migration record. downgrade() restores it.
+    op.execute(
+        "ALTER TABLE threat_intelligence "
+        "DROP CONSTRAINT IF EXISTS threat_intelligence_alert_id_fkey"
+    )
+
+    # 4. Copy existing rows and swap names inside the migration transaction.
+    #    alerts_id_seq is OWNED BY the old table's id column (SERIAL), while
+    #    LIKE ... INCLUDING DEFAULTS gave the new table a default that calls
+    #    it - ownership must move to the new table before the old one goes,
+    #    or DROP TABLE aborts trying to take the still-referenced sequence
+    #    down with it.
+    op.execute("INSERT INTO alerts_partitioned SELECT * FROM alerts")
+    op.execute("ALTER TABLE alerts RENAME TO alerts_old")
+    op.execute("ALTER TABLE alerts_partitioned RENAME TO alerts")
+    op.execute("ALTER SEQUENCE alerts_id_seq OWNED BY alerts.id")
+    op.execute("DROP TABLE alerts_old")
+
+    # 5. Recreate the secondary indexes on the partitioned parent. This runs
+    #    after alerts_old is gone so the original index names are free again.
+    for stmt in _ALERT_INDEXES:
+        op.execute(stmt)
+
+    # 6. Advance the sequence past the copied rows. No exception guard: if
+    #    the sequence wiring above is wrong this must fail loudly, not leave
+    #    a table whose inserts break later.
+    op.execute("""
+        SELECT setval(pg_get_serial_sequence('alerts', 'id'),
+                      COALESCE((SELECT max(id) FROM alerts), 1))
+    """)
+
+
+def downgrade() -> None:
+    # Collapse partitions back into a plain table. As in upgrade(), indexes
+    # are recreated explicitly - copying them would drag along the composite
+    # (id, timestamp) PK that the plain table must not keep.
+    op.execute("""
+        CREATE TABLE alerts_plain (
+            LIKE alerts INCLUDING DEFAULTS
+        );
+    """)
+    op.execute("INSERT INTO alerts_plain SELECT * FROM alerts")
+    # Mirror of the upgrade's sequence handoff: ownership has to reach the
+    # plain table before the partitioned one is dropped, or the CASCADE
+    # takes the sequence (and the plain table's default) with it.
+    op.execute("ALTER SEQUENCE alerts_id_seq OWNED BY alerts_plain.id")
+    op.execute("DROP TABLE alerts CASCADE")
+    op.execute("ALTER TABLE alerts_plain RENAME TO alerts")
+    op.execute("ALTER TABLE alerts ADD PRIMARY KEY (id)")
+    for stmt in _ALERT_INDEXES:
+        op.execute(stmt)
+
+    # id is unique again, so the FK dropped in upgrade() can come back.
+    op.execute("""
+        ALTER TABLE threat_intelligence
+        ADD CONSTRAINT threat_intelligence_alert_id_fkey
+        FOREIGN KEY (alert_id) REFERENCES alerts (id)
+    """)
@@ -5,6 +5,7 @@ from fastapi import APIRouter, HTTPException, Header, Depends
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
+import hmac
 import secrets
 import logging
 import traceback
@@ -260,7 +261,8 @@ async def device_heartbeat(
             logger.warning(f"❌ Heartbeat: Unknown device {x_sentry_id}")
             raise HTTPException(status_code=404, detail="Device not found")
         
-        if device["api_key"] != x_sentry_key:
+        # Constant-time compare so timing can't leak key prefixes
+        if not hmac.compare_digest(device["api_key"] or "", x_sentry_key):
             logger.warning(f"❌ Heartbeat: Invalid key for {x_sentry_id}")
             raise HTTPException(status_code=403, detail="Invalid API key")
         
@@ -24,6 +24,7 @@ from sqlalchemy import (
     Boolean,
     Enum as SQLEnum
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, relationship
 
@@ -134,7 +135,7 @@ class Alert(Base):
     threat_score = Column(Float, nullable=True)
     risk_level = Column(String(20), nullable=True)
     
-    raw_data = Column(JSON, nullable=True)
+    raw_data = Column(JSONB, nullable=True)
     network_context = Column(JSON, nullable=True)
     correlations = Column(JSON, nullable=True)
     indicators = Column(JSON, nullable=True)
@@ -154,6 +155,7 @@ class Alert(Base):
         Index('idx_alerts_timestamp_severity', 'timestamp', 'severity'),
         Index('idx_alerts_source_type', 'source', 'alert_type'),
         Index('idx_alerts_threat_score', 'threat_score'),
+        Index('idx_raw_data_gin', 'raw_data', postgresql_using='gin', postgresql_ops={'raw_data': 'jsonb_path_ops'}),
     )
 
 class ThreatIntelligence(Base):
@@ -50,6 +50,10 @@ class AlertRequest(BaseModel):
     network_context: Optional[dict[str, Any]] = Field(default=None, description="Network context")
     indicators: list[str] = Field(default_factory=list, description="Threat indicators")
 
+class BulkAlertRequest(BaseModel):
+    """Batch of alerts escalated in one request by a Sentry edge device"""
+    alerts: list[AlertRequest] = Field(..., min_length=1, max_length=64, description="Alerts in arrival order")
+
 class ThreatAnalysisRequest(BaseModel):
     """Request for threat analysis"""
     time_window: int = Field(default=3600, ge=60, le=86400, description="Analysis time window in seconds")
@@ -90,6 +94,12 @@ class AlertResponse(BaseModel):
     correlations: list[dict[str, Any]] = Field(default_factory=list)
     processing_time_ms: int
 
+class BulkAlertResponse(BaseModel):
+    """Response for bulk alert ingestion"""
+    accepted: int
+    filtered: int
+    alert_ids: list[int] = Field(default_factory=list)
+
 class ThreatInfo(BaseModel):
     """Threat information"""
     threat_id: str
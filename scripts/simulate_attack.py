@@ -7,6 +7,7 @@ Scenarios: recon, intrusion, exfiltration, full, critical
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import sys
 import random
@@ -22,6 +23,14 @@ if "--local" in sys.argv:
     ORACLE_URL = ORACLE_URL_LOCAL
     sys.argv.remove("--local")
 
+# Precompute the endpoint and reuse one pooled session instead of
+# rebuilding the connection pool (and re-doing TLS handshakes) per alert
+ALERTS_URL = f"{ORACLE_URL}/api/alerts"
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=64)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
 # Realistic external IPs (these are documentation/test IPs, safe to use)
 ATTACKER_IPS = [
     "45.33.32.156",    # Scanme.nmap.org
@@ -34,7 +43,7 @@ ATTACKER_IPS = [
 def send_alert(alert_data: dict):
     """Send alert to Oracle"""
     try:
-        resp = requests.post(f"{ORACLE_URL}/api/alerts", json=alert_data, timeout=5)
+        resp = SESSION.post(ALERTS_URL, json=alert_data, timeout=5)
         status = "✅" if resp.status_code in (200, 201) else "❌"
         print(f"{status} [{alert_data['severity'].upper()}] {alert_data['title']}")
         return resp.status_code in (200, 201)
@@ -10,23 +10,32 @@ Now includes:
 """
 
 import asyncio
+import functools
+import itertools
 import json
 import logging
+import orjson
 import os
 import random
+import re
+import shutil
+import sqlite3
 import string
+import sys
+import time
 import uuid
 import httpx
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from contextlib import asynccontextmanager
 
 import aiofiles
-from fastapi import FastAPI, HTTPException, BackgroundTasks, status, Request
+from fastapi import FastAPI, HTTPException, status, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 import uvicorn
 from pydantic import BaseModel
@@ -43,12 +52,18 @@ CONFIG_FILE = DATA_DIR / "sentry_config.json"
 
 # --- PLATFORM DETECTION LOGIC ---
 
+# One-shot NAME= extraction from /etc/os-release
+_OSREL_RE = re.compile(rb'(?m)^NAME="?([^"\n]+)')
+
 class EnhancedPlatformDetector:
     def __init__(self):
         self.container_info = self._detect_container_environment()
         self.os_info = self._detect_os()
         self.network_interfaces = self._detect_network_interfaces()
         self.docker_capabilities = self._detect_docker_capabilities()
+        # Precompute getter results - detection is immutable for the process lifetime
+        self._os_info_dict = {"name": self.os_info.get("distribution", "unknown")}
+        self._hardware_info = {"cpu_cores": os.cpu_count() or 1, "memory_gb": 4}
 
     def _detect_container_environment(self):
         container_info = {"is_container": False, "type": "unknown", "runtime": "unknown"}
@@ -57,10 +72,9 @@ class EnhancedPlatformDetector:
                 container_info["is_container"] = True
                 container_info["type"] = "docker"
             elif Path("/proc/1/cgroup").exists():
-                with open("/proc/1/cgroup", "r") as f:
-                    if "docker" in f.read():
-                        container_info["is_container"] = True
-                        container_info["type"] = "docker"
+                if b"docker" in Path("/proc/1/cgroup").read_bytes():
+                    container_info["is_container"] = True
+                    container_info["type"] = "docker"
         except OSError:  # Container detection is best-effort
             pass
         return container_info
@@ -70,38 +84,31 @@ class EnhancedPlatformDetector:
         os_info = {"system": platform.system(), "release": platform.release(), "distribution": "unknown"}
         if os_info["system"] == "Linux":
             try:
-                if Path("/etc/os-release").exists():
-                    with open("/etc/os-release", "r") as f:
-                        for line in f:
-                            if line.startswith("NAME="): os_info["distribution"] = line.split("=")[1].strip().strip('"')
+                # One read + C-level regex instead of per-line iteration
+                m = _OSREL_RE.search(Path("/etc/os-release").read_bytes())
+                if m:
+                    os_info["distribution"] = m.group(1).decode()
             except OSError:  # OS detection is best-effort
                 pass
         return os_info
 
     def _detect_network_interfaces(self):
-        interfaces = []
+        # /sys/class/net is ~100x cheaper than forking `ip link show` and
+        # avoids parsing textual output
         try:
-            import subprocess
-            result = subprocess.run(["ip", "link", "show"], capture_output=True, text=True)
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if ': ' in line and line.strip().startswith(tuple('0123456789')):
-                        interfaces.append(line.split(':')[1].strip().split('@')[0])
-        except Exception: interfaces = ["eth0"]
-        return interfaces
+            return [p.name for p in Path("/sys/class/net").iterdir() if p.name != "lo"]
+        except Exception:
+            return ["eth0"]
 
     def _detect_docker_capabilities(self):
-        capabilities = {"available": False}
+        # Socket presence check instead of forking `docker --version`
         try:
-            import subprocess
-            if subprocess.run(["docker", "--version"], capture_output=True).returncode == 0:
-                capabilities["available"] = True
-        except (OSError, FileNotFoundError):  # Docker detection is best-effort
-            pass
-        return capabilities
+            return {"available": Path("/var/run/docker.sock").exists()}
+        except Exception:  # Docker detection is best-effort
+            return {"available": False}
 
-    def get_os_info(self): return {"name": self.os_info.get("distribution", "unknown")}
-    def get_hardware_info(self): return {"cpu_cores": os.cpu_count() or 1, "memory_gb": 4}
+    def get_os_info(self): return self._os_info_dict
+    def get_hardware_info(self): return self._hardware_info
     def get_network_interfaces(self): return self.network_interfaces
     def is_docker_available(self): return self.docker_capabilities.get("available", False)
 
@@ -116,7 +123,7 @@ class BasicPlatformDetector:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     id: str
     timestamp: datetime
@@ -128,6 +135,20 @@ class Alert:
     confidence: float = 0.0
     status: str = "new"
 
+    def to_dict(self) -> dict[str, Any]:
+        """Shallow dict view - avoids dataclasses.asdict's recursive deep-copy."""
+        return {
+            "id": self.id,
+            "timestamp": self.timestamp,
+            "severity": self.severity,
+            "source": self.source,
+            "event_type": self.event_type,
+            "description": self.description,
+            "raw_data": self.raw_data,
+            "confidence": self.confidence,
+            "status": self.status,
+        }
+
 class AlertRequest(BaseModel):
     source: str
     severity: str
@@ -165,6 +186,9 @@ SURICATA_CATEGORY_TO_MITRE = {
     "Not Suspicious Traffic": None,  # No MITRE mapping
     "Unknown Traffic": None,
 }
+# Intern the long category keys so repeated lookups from identical Suricata
+# payloads short-circuit on pointer equality instead of re-hashing full strings
+SURICATA_CATEGORY_TO_MITRE = {sys.intern(k): v for k, v in SURICATA_CATEGORY_TO_MITRE.items()}
 
 class HealthResponse(BaseModel):
     status: str
@@ -174,27 +198,168 @@ class HealthResponse(BaseModel):
 
 # --- CORE SERVICE LOGIC ---
 
-async def escalate_to_oracle(alert_data: dict[str, Any]):
-    """Pushes local anomaly evidence to the Azure-powered Oracle Cloud"""
-    oracle_url = f"{ORACLE_URL}/api/alerts"
-    
+# Classification tables hoisted to module level - built once, O(1) lookups per alert
+ZEEK_ALERT_TYPES = frozenset({
+    "zeek_scan", "zeek_recon", "zeek_attack", "zeek_exploit",
+    "zeek_policy", "zeek_intel", "zeek_weird", "zeek_notice",
+})
+ALERT_TYPE_MAP = {
+    "network_anomaly": "network_anomaly",
+    "ids_alert": "ids_alert",
+    "signature_match": "signature_match",
+    "intrusion_detection": "intrusion_detection",
+}
+
+# Suricata severity (1=high .. 4=low) to our severity labels
+SURICATA_SEVERITY_MAP = {1: "critical", 2: "high", 3: "medium", 4: "low"}
+
+# Sliding window for collapsing duplicate escalations of the same flow
+AGGREGATION_WINDOW = 10.0
+
+# Bound lookups - saves a LOAD_ATTR per alert in the normalization hot path
+_MITRE_LOOKUP = SURICATA_CATEGORY_TO_MITRE.get
+_SEV_LOOKUP = SURICATA_SEVERITY_MAP.get
+_ALERT_TYPE_LOOKUP = ALERT_TYPE_MAP.get
+
+def _build_normalized_suricata(alert_info, network_info, flow_id, http, dns, tls, fileinfo):
+    """
+    Pure-Python enrichment for a Suricata EVE alert: severity mapping, MITRE
+    lookup, description and raw_data construction. Kept free of async/framework
+    code so it can be compiled (Cython/mypyc) if EVE rates ever warrant it.
+    """
+    suri_severity = alert_info.get("severity", 3)
+    severity = _SEV_LOOKUP(suri_severity, "medium")
+
+    category = sys.intern(alert_info.get("category", "Unknown"))
+    mitre_technique = _MITRE_LOOKUP(category)
+
+    signature = alert_info.get("signature", "Unknown signature")
+    src_ip = network_info.get("src_ip", "unknown")
+    dest_ip = network_info.get("dest_ip", "unknown")
+    dest_port = network_info.get("dest_port", "")
+    protocol = network_info.get("protocol", "TCP")
+
+    # Single allocation - no += re-concatenation of the base string
+    description = (
+        f"{signature} | {src_ip} → {dest_ip}:{dest_port} ({protocol})"
+        + (f" [MITRE: {mitre_technique}]" if mitre_technique else "")
+    )
+
+    raw_data = {
+        "signature_id": alert_info.get("signature_id"),
+        "signature": signature,
+        "category": category,
+        "src_ip": src_ip,
+        "dest_ip": dest_ip,
+        "src_port": network_info.get("src_port"),
+        "dest_port": dest_port,
+        "protocol": protocol,
+        "flow_id": flow_id,
+        "mitre_technique": mitre_technique,
+    }
+    # Add protocol-specific context if available
+    if http:
+        raw_data["http"] = http
+    if dns:
+        raw_data["dns"] = dns
+    if tls:
+        raw_data["tls"] = tls
+    if fileinfo:
+        raw_data["fileinfo"] = fileinfo
+
+    confidence = 0.95 if suri_severity <= 2 else 0.7
+    return severity, category, mitre_technique, signature, description, raw_data, confidence
+
+@functools.lru_cache(maxsize=1)
+def _detect_hardware_id() -> str:
+    """Resolve the persistent hardware ID once per process.
+
+    Reads /proc/cpuinfo as one bytes buffer and scans in C instead of
+    iterating lines in Python.
+    """
+    # 1. Try Raspberry Pi Serial
+    try:
+        data = Path("/proc/cpuinfo").read_bytes()
+        i = data.find(b"\nSerial")
+        if i >= 0:
+            serial = data[i:i + 64].split(b":", 1)[1].split(b"\n", 1)[0].strip().decode()
+            if serial != "0000000000000000":
+                return f"pi-{serial}"
+    except OSError:
+        pass
+
+    # 2. Try Linux Machine ID
+    try:
+        return f"linux-{Path('/etc/machine-id').read_bytes().strip().decode()}"
+    except OSError:
+        pass
+
+    # 3. Fallback: Generated/Stored UUID
+    uuid_file = DATA_DIR / "hardware_id"
+    if uuid_file.exists():
+        return uuid_file.read_text().strip()
+
+    new_id = f"sentry-{uuid.uuid4().hex[:12]}"
+    try:
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        uuid_file.write_text(new_id)
+    except OSError:
+        pass
+    return new_id
+
+def ttl_cache(seconds: float):
+    """Caches an endpoint's serialized response for `seconds`.
+
+    The dashboard polls these routes far faster than their data changes -
+    hits serve the already-encoded orjson bytes with zero serialization work.
+    """
+    def decorator(func):
+        cached = {"expires": 0.0, "body": b"", "version": 0, "etag": '"0"'}
+
+        async def wrapper(request: Request):
+            now = time.monotonic()
+            if now >= cached["expires"]:
+                body = orjson.dumps(await func(), default=str)
+                if body != cached["body"]:
+                    cached["body"] = body
+                    cached["version"] += 1
+                    cached["etag"] = f'"{cached["version"]}"'
+                cached["expires"] = now + seconds
+            # Unchanged since the client's last poll - skip the body entirely
+            if request.headers.get("if-none-match") == cached["etag"]:
+                return Response(status_code=304, headers={"ETag": cached["etag"]})
+            return Response(content=cached["body"], media_type="application/json",
+                            headers={"ETag": cached["etag"]})
+
+        # Keep the route name/docs without functools.wraps - FastAPI must see
+        # wrapper's own signature so it injects the Request
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+    return decorator
+
+# Static payload skeleton + precomputed titles for the known event types -
+# copied and patched per alert instead of rebuilt from scratch
+_PAYLOAD_TEMPLATE = {
+    "source": "bridge", "alert_type": "", "severity": "medium", "title": "",
+    "description": "", "raw_data": None, "network_context": None,
+    "indicators": None, "timestamp": "",
+}
+_TITLES = {
+    t: f"Sentry Alert: {t.upper().replace('_', ' ')}"
+    for t in (*ZEEK_ALERT_TYPES, *ALERT_TYPE_MAP, "unknown")
+}
+
+def _build_oracle_payload(alert_data: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a local alert into Oracle's alert schema."""
     # Normalize alert_type to match Oracle's AlertType enum
     event_type = alert_data.get("event_type", "unknown")
-    alert_type_map = {
-        "network_anomaly": "network_anomaly",
-        "ids_alert": "ids_alert",
-        "signature_match": "signature_match",
-        "intrusion_detection": "intrusion_detection",
-    }
     # Handle zeek notice types (zeek_scan, zeek_recon, etc.)
-    if event_type.startswith("zeek_"):
-        alert_type = event_type if event_type in [
-            "zeek_scan", "zeek_recon", "zeek_attack", "zeek_exploit",
-            "zeek_policy", "zeek_intel", "zeek_weird", "zeek_notice"
-        ] else "zeek_notice"
+    if event_type[:5] == "zeek_":
+        alert_type = event_type if event_type in ZEEK_ALERT_TYPES else "zeek_notice"
     else:
-        alert_type = alert_type_map.get(event_type, "unknown")
-    
+        alert_type = _ALERT_TYPE_LOOKUP(event_type, "unknown")
+
     # Extract network context if available
     network_context = alert_data.get("network", {})
     if not network_context and "raw_data" in alert_data:
@@ -206,7 +371,7 @@ async def escalate_to_oracle(alert_data: dict[str, Any]):
             "dest_port": raw.get("dest_port"),
             "protocol": raw.get("protocol"),
         }
-    
+
     # Extract indicators from raw_data
     indicators = []
     if "raw_data" in alert_data:
@@ -217,34 +382,74 @@ async def escalate_to_oracle(alert_data: dict[str, Any]):
             indicators.append(f"SIG:{raw['signature'][:50]}")
         if raw.get("src_ip"):
             indicators.append(f"IP:{raw['src_ip']}")
-    
-    async with httpx.AsyncClient() as client:
-        payload = {
-            "source": alert_data.get("source", "bridge"),
-            "alert_type": alert_type,
-            "severity": alert_data.get("severity", "medium"),
-            "title": f"Sentry Alert: {event_type.upper().replace('_', ' ')}",
-            "description": alert_data.get("description", "Security alert from Sentry"),
-            "raw_data": alert_data.get("raw_data", {}),
-            "network_context": network_context,
-            "indicators": indicators,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
-        try:
-            response = await client.post(oracle_url, json=payload, timeout=10.0)
-            if response.status_code in (200, 201, 202):
-                logger.info(f"☁️ Oracle Cloud Escalation: {response.status_code} ({alert_type})")
-                bridge_service.local_stats["escalations"] += 1
-            elif response.status_code == 422:
-                logger.error(f"❌ Oracle Schema Mismatch: {response.text}")
-            else:
-                logger.warning(f"⚠️ Oracle responded: {response.status_code}")
-        except httpx.TimeoutException:
-            logger.error(f"❌ Oracle Cloud Timeout")
-        except httpx.ConnectError:
-            logger.error(f"❌ Oracle Cloud Unreachable (connection refused)")
-        except Exception as e:
-            logger.error(f"❌ Oracle Cloud Error: {e}")
+
+    payload = _PAYLOAD_TEMPLATE.copy()
+    payload["source"] = alert_data.get("source", "bridge")
+    payload["alert_type"] = alert_type
+    payload["severity"] = alert_data.get("severity", "medium")
+    payload["title"] = _TITLES.get(event_type) or f"Sentry Alert: {event_type.upper().replace('_', ' ')}"
+    payload["description"] = alert_data.get("description", "Security alert from Sentry")
+    payload["raw_data"] = alert_data.get("raw_data", {})
+    payload["network_context"] = network_context
+    payload["indicators"] = indicators
+    payload["timestamp"] = bridge_service._now_iso
+    return payload
+
+async def escalate_to_oracle(alert_data: dict[str, Any]):
+    """Pushes local anomaly evidence to the Azure-powered Oracle Cloud"""
+    oracle_url = f"{ORACLE_URL}/api/alerts"
+    client = bridge_service.get_http_client()
+    payload = _build_oracle_payload(alert_data)
+    alert_type = payload["alert_type"]
+    try:
+        # Pre-serialize with orjson so httpx doesn't re-encode with stdlib json
+        response = await client.post(
+            oracle_url,
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=10.0,
+        )
+        if response.status_code in (200, 201, 202):
+            logger.info(f"☁️ Oracle Cloud Escalation: {response.status_code} ({alert_type})")
+            bridge_service.local_stats["escalations"] += 1
+            bridge_service.mark_stats_dirty()
+        elif response.status_code == 422:
+            logger.error(f"❌ Oracle Schema Mismatch: {response.text}")
+        else:
+            logger.warning(f"⚠️ Oracle responded: {response.status_code}")
+    except httpx.TimeoutException:
+        logger.error(f"❌ Oracle Cloud Timeout")
+    except httpx.ConnectError:
+        logger.error(f"❌ Oracle Cloud Unreachable (connection refused)")
+    except Exception as e:
+        logger.error(f"❌ Oracle Cloud Error: {e}")
+
+async def escalate_bulk_to_oracle(batch: list[dict[str, Any]]) -> bool:
+    """POST a batch of alerts in one request; False means caller should
+    fall back to per-alert escalation."""
+    client = bridge_service.get_http_client()
+    payloads = [_build_oracle_payload(a) for a in batch]
+    try:
+        response = await client.post(
+            f"{ORACLE_URL}/api/alerts/bulk",
+            content=orjson.dumps({"alerts": payloads}),
+            headers={"Content-Type": "application/json"},
+            timeout=10.0,
+        )
+    except Exception as e:
+        logger.error(f"❌ Oracle bulk escalation error: {e}")
+        return True  # transport failure - retrying one-by-one won't help
+    if response.status_code == 404:
+        # Oracle predates the bulk endpoint - stop trying it
+        bridge_service.bulk_escalation_ok = False
+        return False
+    if response.status_code in (200, 201, 202):
+        logger.info(f"☁️ Oracle Cloud Bulk Escalation: {response.status_code} ({len(batch)} alerts)")
+        bridge_service.local_stats["escalations"] += len(batch)
+        bridge_service.mark_stats_dirty()
+    else:
+        logger.warning(f"⚠️ Oracle bulk responded: {response.status_code}")
+    return True
 
 class BridgeService:
     def __init__(self):
@@ -270,6 +475,11 @@ class BridgeService:
         self.is_setup_mode = self.api_key is None
         self.claim_token = None  # Will be set by Oracle registration
         self.connected_devices_count = 1 if not self.is_setup_mode else 0
+
+        # Serialized /api/setup/status body, rebuilt only when setup state
+        # mutates - the UI polls this endpoint constantly
+        self._status_cache_bytes: Optional[bytes] = None
+        self._status_version = 0
         
         if self.is_setup_mode:
             logger.warning(f"⚠️ SETUP MODE: Sentry {self.hardware_id} waiting for claim...")
@@ -277,7 +487,16 @@ class BridgeService:
             logger.info(f"✅ Sentry Online: {self.sentry_id}")
             self.oracle_client.update_api_key(self.api_key)
             
-        self.alerts: list[Alert] = []
+        # Bounded buffer: O(1) eviction, constant memory under sustained traffic
+        self.alerts: deque[Alert] = deque(maxlen=5000)
+        # Parallel deque of orjson-encoded alerts - serialized once on insert,
+        # GET /alerts just joins the bytes
+        self._alert_json: deque[bytes] = deque(maxlen=5000)
+        self.alerts_version = 0  # Bumped per alert, backs the /alerts ETag
+        # Collision-proof IDs without a clock read per alert: process-start
+        # epoch prefix plus a plain counter increment
+        self._alert_seq = itertools.count(1)
+        self._alert_prefix = f"alrt_{int(time.time())}"
         self.services_status: dict[str, dict[str, Any]] = {}
         
         self.local_stats = {
@@ -286,15 +505,62 @@ class BridgeService:
             "escalations": 0,
             "start_time": datetime.now()
         }
+        # SSE broadcast state: stats are encoded once per change and pushed to
+        # all /api/local-stats/stream subscribers instead of being re-polled.
+        # One Event per subscriber (set on broadcast, cleared by its owner) -
+        # a shared set()/clear() pair would lose wakeups for any subscriber
+        # not already parked in wait() when the burst ended
+        self._stats_listeners: set[asyncio.Event] = set()
+        self._stats_bytes = orjson.dumps(self.local_stats, default=str)
         
         # Initialize stats containers
         self.suricata_stats = {
             "alerts_received": 0,
             "by_severity": {"critical": 0, "high": 0, "medium": 0, "low": 0},
             "by_category": {},
-            "recent_signatures": [],
+            "recent_signatures": deque(maxlen=20),
             "mitre_techniques": {},
         }
+        # Set mirror of recent_signatures for O(1) membership checks
+        self._recent_sig_set: set[str] = set()
+
+        # Coarse cached clock (refreshed every 50ms by _clock_loop) - hot paths
+        # read these instead of paying datetime.now()+isoformat() per alert
+        self._now_ts = time.time()
+        self._now_dt = datetime.now()
+        self._now_iso = datetime.now(timezone.utc).isoformat()
+
+        # Coalesced stats: hot path does one counter increment per alert,
+        # a 100ms timer merges into the structured suricata_stats view
+        self._pending_suricata: defaultdict[tuple, int] = defaultdict(int)
+
+        # Accounts-file cache for the status endpoint - the UI polls it at
+        # 1-5 Hz, so only re-read/parse when the file mtime actually changes
+        self._accounts_count_cache = 0
+        self._accounts_count_mtime = -1.0
+
+        # Discovery cache: (key, deadline, payload) - key is conn.log identity
+        # plus oracle status, the monotonic deadline caps staleness at 2s
+        self._discovery_cache: Optional[tuple[tuple, float, dict]] = None
+
+        # Live asset state fed by the conn.log follower task - discovery
+        # requests read this instead of touching the log file
+        self._conn_offset = 0
+        self.discovered_ips: OrderedDict[str, None] = OrderedDict()
+
+        # Shared HTTP client for Oracle escalations - keep-alive avoids a TLS
+        # handshake per alert during bursts (created lazily, closed in lifespan)
+        self.http_client: Optional[httpx.AsyncClient] = None
+
+        # Fire-and-forget escalation pipeline: endpoints enqueue, worker tasks
+        # drain - request latency stays independent of Oracle round-trip time
+        self.escalation_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+        # Bulk endpoint support, flipped off on the first 404 from Oracle
+        self.bulk_escalation_ok = True
+
+        # Duplicate-escalation aggregation: alerts sharing a flow key within
+        # AGGREGATION_WINDOW collapse into one escalation carrying a count
+        self._agg_table: dict[tuple, dict[str, Any]] = {}
 
         self.data_paths = {
             "zeek": Path("/opt/zeek/logs"),
@@ -303,39 +569,49 @@ class BridgeService:
             "bridge": Path("/app/data")
         }
         self._setup_data_paths()
-    
+
+        # On-disk alert store: WAL sqlite keeps retention unbounded while the
+        # in-memory deque stays a small hot window for the UI. add_alert only
+        # appends to the pending list; _alert_store_flush_loop batches the
+        # rows into one off-loop executemany+commit
+        self.alerts_db = self._init_alert_store()
+        self._pending_alert_rows: list[tuple] = []
+
+    def _init_alert_store(self) -> Optional[sqlite3.Connection]:
+        """Open the local sqlite alert store (best-effort; None if unavailable)."""
+        try:
+            conn = sqlite3.connect(self.data_paths["bridge"] / "alerts.db", check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS alerts (
+                    id TEXT PRIMARY KEY,
+                    ts TEXT NOT NULL,
+                    severity TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    description TEXT NOT NULL,
+                    confidence REAL,
+                    raw_json BLOB
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_ts ON alerts(ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_severity ON alerts(severity)")
+            conn.commit()
+            return conn
+        except Exception as e:
+            logger.warning(f"⚠️ Alert store unavailable, in-memory only: {e}")
+            return None
+
     def _get_hardware_id(self) -> str:
         """Get persistent unique hardware ID (CPU Serial or UUID)"""
-        # 1. Try Raspberry Pi Serial
-        try:
-            with open("/proc/cpuinfo", "r") as f:
-                for line in f:
-                    if line.startswith("Serial"):
-                        serial = line.split(":")[1].strip()
-                        if serial != "0000000000000000": return f"pi-{serial}"
-        except Exception: pass
-            
-        # 2. Try Linux Machine ID
-        try:
-            with open("/etc/machine-id", "r") as f: return f"linux-{f.read().strip()}"
-        except Exception: pass
-            
-        # 3. Fallback: Generated/Stored UUID
-        uuid_file = DATA_DIR / "hardware_id"
-        if uuid_file.exists(): return uuid_file.read_text().strip()
-        
-        new_id = f"sentry-{uuid.uuid4().hex[:12]}"
-        try:
-            DATA_DIR.mkdir(parents=True, exist_ok=True)
-            uuid_file.write_text(new_id)
-        except Exception: pass
-        return new_id
+        return _detect_hardware_id()
 
     def _load_configuration(self) -> dict[str, Any]:
         """Load saved config from JSON file"""
         if self.config_path.exists():
             try:
-                return json.loads(self.config_path.read_text())
+                return orjson.loads(self.config_path.read_bytes())
             except Exception as e:
                 logger.warning(f"Config load error: {e}")
         return {}
@@ -345,6 +621,7 @@ class BridgeService:
         if not self.is_setup_mode:
             return
 
+        prev_token = self.claim_token
         try:
             logger.info(f"📡 Registering with Oracle: {ORACLE_URL}")
             response = await self.oracle_client.register_device(self.hardware_id)
@@ -368,6 +645,9 @@ class BridgeService:
                 self.claim_token = self._generate_fallback_code()
                 logger.warning(f"⚠️ Using local fallback code: {self.claim_token}")
 
+        if self.claim_token != prev_token:
+            self.invalidate_status_cache()
+
     def _generate_fallback_code(self) -> str:
         """Generate a 6-char fallback pairing code like 'A3K-9M2'"""
         chars = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
@@ -417,19 +697,23 @@ class BridgeService:
                 "configured_at": datetime.now(timezone.utc).isoformat()
             }
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            self.config_path.write_text(json.dumps(config, indent=2))
+            # File writes go through a thread so the event loop never blocks on fsync
+            await asyncio.to_thread(
+                self.config_path.write_bytes, orjson.dumps(config, option=orjson.OPT_INDENT_2)
+            )
             
             self.api_key = api_key
             self.is_setup_mode = False
             self.claim_token = None
             self.connected_devices_count = 1
-            
+            self.invalidate_status_cache()
+
             # Save account entry with unique nickname
             accounts_file = DATA_DIR / "connected_accounts.json"
             accounts = []
             if accounts_file.exists():
                 try:
-                    accounts = json.loads(accounts_file.read_text())
+                    accounts = orjson.loads(accounts_file.read_bytes())
                 except:
                     pass
             
@@ -444,29 +728,40 @@ class BridgeService:
                 "api_key_prefix": api_key[:10] + "...",
                 "connected_at": datetime.now(timezone.utc).isoformat()
             })
-            accounts_file.write_text(json.dumps(accounts, indent=2))
+            await asyncio.to_thread(
+                accounts_file.write_bytes, orjson.dumps(accounts, option=orjson.OPT_INDENT_2)
+            )
             
             logger.info(f"✅ Sentry registered with Oracle! Device is now ONLINE")
             return True
-        except Exception as e:
-            logger.error(f"❌ Config save failed: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("❌ Config save failed")
             return False
 
+    def _count_connected_accounts(self) -> int:
+        """Count accounts, re-parsing the file only when its mtime changes."""
+        accounts_file = DATA_DIR / "connected_accounts.json"
+        try:
+            mtime = accounts_file.stat().st_mtime
+        except OSError:
+            return 1  # Default when file missing
+        if mtime != self._accounts_count_mtime:
+            try:
+                self._accounts_count_cache = len(orjson.loads(accounts_file.read_bytes()))
+                self._accounts_count_mtime = mtime
+            except Exception:
+                return 1
+        return self._accounts_count_cache
+
+    def invalidate_status_cache(self):
+        """Drop the cached setup-status bytes after a state mutation."""
+        self._status_cache_bytes = None
+        self._status_version += 1
+
     def get_setup_status(self) -> dict[str, Any]:
         """Return status for the Local UI"""
         if not self.is_setup_mode:
-            # Count connected accounts
-            accounts_file = DATA_DIR / "connected_accounts.json"
-            account_count = 1  # Default
-            if accounts_file.exists():
-                try:
-                    accounts = json.loads(accounts_file.read_text())
-                    account_count = len(accounts)
-                except:
-                    pass
-            
+            account_count = self._count_connected_accounts()
             return {
                 "configured": True, 
                 "sentry_id": self.sentry_id,
@@ -489,16 +784,161 @@ class BridgeService:
                 self.data_paths[service] = Path(f"/tmp/cardea/{service}")
                 self.data_paths[service].mkdir(parents=True, exist_ok=True)
 
+    def flush_suricata_stats(self):
+        """Merge pending counter increments into the structured stats view."""
+        if not self._pending_suricata:
+            return
+        pending, self._pending_suricata = self._pending_suricata, defaultdict(int)
+        stats = self.suricata_stats
+        for (severity, category, mitre), n in pending.items():
+            stats["alerts_received"] += n
+            stats["by_severity"][severity] = stats["by_severity"].get(severity, 0) + n
+            stats["by_category"][category] = stats["by_category"].get(category, 0) + n
+            if mitre:
+                stats["mitre_techniques"][mitre] = stats["mitre_techniques"].get(mitre, 0) + n
+
+    async def _clock_loop(self):
+        """Refresh the cached coarse clock every 50ms."""
+        while True:
+            self._now_ts = time.time()
+            self._now_dt = datetime.now()
+            self._now_iso = datetime.now(timezone.utc).isoformat()
+            await asyncio.sleep(0.05)
+
+    def _read_conn_delta(self, path: Path) -> list[str]:
+        """Read conn.log bytes appended since the last poll (run off-loop)."""
+        with open(path, "rb") as f:
+            f.seek(self._conn_offset)
+            data = f.read()
+            self._conn_offset = f.tell()
+        return data.decode(errors="replace").splitlines()
+
+    async def _follow_zeek_conn(self):
+        """Incrementally tail conn.log, keeping a live bounded set of asset IPs.
+
+        Each appended byte is parsed exactly once here, so discovery requests
+        never touch the file.
+        """
+        zeek_log = self.data_paths["zeek"] / "conn.log"
+        first_pass = True
+        while True:
+            try:
+                st = zeek_log.stat()
+                if st.st_size < self._conn_offset:
+                    self._conn_offset = 0  # log rotated
+                elif first_pass:
+                    # Don't replay a huge existing log - start from its tail
+                    self._conn_offset = max(0, st.st_size - 64 * 1024)
+                first_pass = False
+                if st.st_size > self._conn_offset:
+                    for line in await asyncio.to_thread(self._read_conn_delta, zeek_log):
+                        if not line or line.startswith('#'):
+                            continue
+                        parts = line.split('\t', 5)
+                        if len(parts) > 4:
+                            ip = parts[4]
+                            if ip in self.discovered_ips:
+                                self.discovered_ips.move_to_end(ip)
+                            else:
+                                self.discovered_ips[ip] = None
+                                if len(self.discovered_ips) > 5:
+                                    self.discovered_ips.popitem(last=False)
+            except OSError:
+                pass  # log not there yet
+            except Exception as e:
+                logger.debug(f"conn.log follow error: {e}")
+            await asyncio.sleep(0.5)
+
+    async def _stats_flush_loop(self):
+        """Background timer that coalesces hot-path stat increments."""
+        while True:
+            await asyncio.sleep(0.1)
+            self.flush_suricata_stats()
+
+    async def _alert_store_flush_loop(self):
+        """Background timer that batches alert-store writes into one commit."""
+        while True:
+            await asyncio.sleep(0.5)
+            await self.flush_alert_store()
+
+    async def flush_alert_store(self):
+        """Write pending alert rows in one executemany+commit, off-loop.
+
+        A burst of alerts costs one fsync instead of one per alert, and the
+        event loop never blocks on sqlite - the write runs in a thread like
+        the other file I/O in this service.
+        """
+        if self.alerts_db is None or not self._pending_alert_rows:
+            return
+        rows, self._pending_alert_rows = self._pending_alert_rows, []
+        try:
+            await asyncio.to_thread(self._write_alert_rows, rows)
+        except Exception as e:
+            logger.debug(f"Alert store flush failed: {e}")
+
+    def _write_alert_rows(self, rows: list[tuple]):
+        self.alerts_db.executemany("INSERT OR REPLACE INTO alerts VALUES (?,?,?,?,?,?,?,?)", rows)
+        self.alerts_db.commit()
+
+    def enqueue_suricata_escalation(self, key: tuple, alert_data: dict[str, Any]):
+        """Escalate the first alert of a flow immediately; duplicates within
+        the window only bump a counter and are flushed as one aggregate."""
+        now = time.monotonic()
+        entry = self._agg_table.get(key)
+        if entry is not None and now - entry["last_ts"] < AGGREGATION_WINDOW:
+            entry["count"] += 1
+            entry["last_ts"] = now
+            return
+        self._agg_table[key] = {"count": 1, "first_ts": now, "last_ts": now, "payload": alert_data}
+        self.enqueue_escalation(alert_data)
+
+    async def _aggregation_flush_loop(self):
+        """Periodically emit one aggregated escalation per deduped flow."""
+        while True:
+            await asyncio.sleep(AGGREGATION_WINDOW)
+            now = time.monotonic()
+            for key, entry in list(self._agg_table.items()):
+                if now - entry["last_ts"] < AGGREGATION_WINDOW:
+                    continue
+                if entry["count"] > 1:
+                    payload = dict(entry["payload"])
+                    payload["description"] = f"{payload.get('description', '')} (x{entry['count']} in {round(now - entry['first_ts'])}s)"
+                    payload["raw_data"] = {**payload.get("raw_data", {}), "count": entry["count"]}
+                    self.enqueue_escalation(payload)
+                del self._agg_table[key]
+
+    def enqueue_escalation(self, alert_data: dict[str, Any]):
+        """Queue an alert for async escalation; drop (and log) if the queue is full."""
+        try:
+            self.escalation_queue.put_nowait(alert_data)
+        except asyncio.QueueFull:
+            self.local_stats["drops"] = self.local_stats.get("drops", 0) + 1
+            logger.warning("⚠️ Escalation queue full - dropping alert")
+
+    def get_http_client(self) -> httpx.AsyncClient:
+        """Return the long-lived escalation client, creating it on first use."""
+        if self.http_client is None or self.http_client.is_closed:
+            self.http_client = httpx.AsyncClient(
+                http2=True,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=30),
+            )
+        return self.http_client
+
+    # Static health-response shape, copied per check with only last_check updated
+    _HEALTH_TEMPLATE = {"status": "healthy", "last_check": "", "details": {}}
+
     async def check_service_health(self, service: str) -> dict[str, Any]:
-        health_info = {"status": "healthy", "last_check": datetime.now().isoformat(), "details": {}}
+        health_info = self._HEALTH_TEMPLATE.copy()
+        health_info["last_check"] = self._now_iso
         if service == "bridge":
-            health_info["details"] = {"alerts_in_buffer": len(self.alerts), "uptime": str(datetime.now() - self.local_stats["start_time"])}
+            health_info["details"] = {"alerts_in_buffer": len(self.alerts), "uptime": str(self._now_dt - self.local_stats["start_time"])}
         return health_info
 
     def add_alert(self, req: AlertRequest) -> Alert:
         alert = Alert(
-            id=f"alrt_{int(datetime.now().timestamp())}",
-            timestamp=datetime.now(),
+            id=f"{self._alert_prefix}_{next(self._alert_seq):08x}",
+            timestamp=self._now_dt,
             severity=req.severity,
             source=req.source,
             event_type=req.event_type,
@@ -507,58 +947,114 @@ class BridgeService:
             confidence=req.confidence
         )
         self.alerts.append(alert)
+        self._alert_json.append(orjson.dumps(alert.to_dict()))
+        self.alerts_version += 1
+        if self.alerts_db is not None:
+            # No disk I/O here - the row waits for the next batched flush
+            self._pending_alert_rows.append(
+                (alert.id, alert.timestamp.isoformat(), alert.severity, alert.source,
+                 alert.event_type, alert.description, alert.confidence,
+                 orjson.dumps(alert.raw_data)),
+            )
         if "score" in req.raw_data:
             self.local_stats["anomaly_score"] = req.raw_data["score"]
+        self.mark_stats_dirty()
         return alert
 
+    def mark_stats_dirty(self):
+        """Re-encode local_stats once and wake all SSE subscribers."""
+        self._stats_bytes = orjson.dumps(self.local_stats, default=str)
+        for event in self._stats_listeners:
+            event.set()
+
     async def get_network_discovery(self) -> dict[str, Any]:
         """Dynamically scans local logs and health to build the map data"""
+        oracle_online = bool(self.oracle_client.last_successful_ping)
+        zeek_log = self.data_paths["zeek"] / "conn.log"
+        try:
+            st = zeek_log.stat()
+            cache_key = (st.st_mtime_ns, st.st_size, oracle_online)
+        except OSError:
+            cache_key = (0, 0, oracle_online)
+        if self._discovery_cache is not None:
+            key, deadline, payload = self._discovery_cache
+            if key == cache_key and time.monotonic() < deadline:
+                return payload
+
         devices = []
         links = []
-        
+
         # Sentry Gateway
-        sentry_status = "online" 
+        sentry_status = "online"
         devices.append({
-            "id": "sentry", "name": f"Sentry [{self.hardware_id[:6]}]", 
+            "id": "sentry", "name": f"Sentry [{self.hardware_id[:6]}]",
             "role": "sentry", "status": sentry_status, "ip": "192.168.1.1"
         })
 
         # Oracle Link
-        oracle_status = "online" if self.oracle_client.last_successful_ping else "offline"
+        oracle_status = "online" if oracle_online else "offline"
         devices.append({
             "id": "oracle", "name": "ORACLE CLOUD", 
             "role": "cloud", "status": oracle_status, "ip": "Azure Endpoint"
         })
         links.append({"source": "oracle", "target": "sentry", "active": oracle_status == "online"})
 
-        # Discover Assets from Zeek conn.log
-        try:
-            zeek_log = self.data_paths["zeek"] / "conn.log"
-            if zeek_log.exists():
-                async with aiofiles.open(zeek_log, mode='r') as f:
-                    content = await f.read()
-                    lines = content.splitlines()
-                    discovered_ips = set()
-                    for line in lines[-50:]:
-                        if not line.startswith('#'):
-                            parts = line.split('\t')
-                            if len(parts) > 4:
-                                discovered_ips.add(parts[4])
-                    
-                    for idx, ip in enumerate(list(discovered_ips)[:5]):
-                        dev_id = f"dev-{idx}"
-                        devices.append({
-                            "id": dev_id, "name": f"Device-{idx}", 
-                            "role": "asset", "category": "pc", "status": "online", "ip": ip
-                        })
-                        links.append({"source": "sentry", "target": dev_id, "active": False})
-        except Exception as e:
-            logger.error(f"Discovery scan failed: {e}")
+        # Assets come from the live conn.log follower - no file I/O here
+        for idx, ip in enumerate(self.discovered_ips):
+            dev_id = f"dev-{idx}"
+            devices.append({
+                "id": dev_id, "name": f"Device-{idx}",
+                "role": "asset", "category": "pc", "status": "online", "ip": ip
+            })
+            links.append({"source": "sentry", "target": dev_id, "active": False})
 
-        return {"devices": devices, "links": links}
+        result = {"devices": devices, "links": links}
+        self._discovery_cache = (cache_key, time.monotonic() + 2.0, result)
+        return result
 
 bridge_service = BridgeService()
 
+ESCALATION_WORKERS = 4
+
+ESCALATION_BATCH_MAX = 32
+ESCALATION_BATCH_WINDOW = 0.2  # seconds to wait for more alerts before posting
+
+async def escalation_worker():
+    """Drains the escalation queue; multiple workers overlap Oracle round-trips.
+
+    Bursts are coalesced into one bulk POST (up to 32 alerts / 200ms window),
+    turning N round-trips into 1. Falls back to per-alert posts if Oracle
+    doesn't expose the bulk endpoint.
+    """
+    queue = bridge_service.escalation_queue
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + ESCALATION_BATCH_WINDOW
+        while len(batch) < ESCALATION_BATCH_MAX:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+        try:
+            sent_bulk = False
+            if len(batch) > 1 and bridge_service.bulk_escalation_ok:
+                sent_bulk = await escalate_bulk_to_oracle(batch)
+            if not sent_bulk:
+                for alert_data in batch:
+                    await escalate_to_oracle(alert_data)
+        except Exception as e:
+            logger.error(f"Escalation worker error: {e}")
+        finally:
+            for _ in batch:
+                queue.task_done()
+
 # --- ZEEK NOTICE INTEGRATION ---
 
 async def handle_zeek_notice_alert(alert_data: dict[str, Any]):
@@ -576,7 +1072,7 @@ async def handle_zeek_notice_alert(alert_data: dict[str, Any]):
         
         # Auto-escalate high/critical Zeek notices to Oracle
         if alert_data['severity'] in ('high', 'critical'):
-            await escalate_to_oracle(alert_data)
+            bridge_service.enqueue_escalation(alert_data)
             
         logger.info(f"🔔 Zeek notice ingested: {alert.id} ({alert_data['severity']})")
     except Exception as e:
@@ -590,7 +1086,10 @@ zeek_notice_monitor = get_notice_monitor(handle_zeek_notice_alert)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info(f"🌉 Bridge Service Online [ID: {bridge_service.hardware_id}]")
-    
+
+    # Open the pooled Oracle session before any task needs it
+    await bridge_service.oracle_client.start()
+
     # Start Zeek notice monitoring
     notice_task = asyncio.create_task(zeek_notice_monitor.start())
     
@@ -601,17 +1100,44 @@ async def lifespan(app: FastAPI):
     
     # Start heartbeat loop (sends heartbeats when device is claimed)
     heartbeat_task = asyncio.create_task(bridge_service._heartbeat_loop())
-    
+
+    # Start escalation workers draining the fire-and-forget queue
+    escalation_tasks = [asyncio.create_task(escalation_worker()) for _ in range(ESCALATION_WORKERS)]
+
+    # Start coalescing stats flusher and coarse clock
+    stats_flush_task = asyncio.create_task(bridge_service._stats_flush_loop())
+    clock_task = asyncio.create_task(bridge_service._clock_loop())
+
+    # Batch alert-store writes off the hot path
+    alert_flush_task = asyncio.create_task(bridge_service._alert_store_flush_loop())
+
+    # Follow conn.log so discovery serves from memory
+    conn_follow_task = asyncio.create_task(bridge_service._follow_zeek_conn())
+
+    # Flush aggregated duplicate escalations
+    agg_flush_task = asyncio.create_task(bridge_service._aggregation_flush_loop())
+
     yield
-    
+
     # Cleanup
     await zeek_notice_monitor.stop()
     notice_task.cancel()
     heartbeat_task.cancel()
+    for t in escalation_tasks:
+        t.cancel()
+    stats_flush_task.cancel()
+    clock_task.cancel()
+    conn_follow_task.cancel()
+    agg_flush_task.cancel()
+    alert_flush_task.cancel()
+    # Drain whatever the flusher hadn't picked up yet
+    await bridge_service.flush_alert_store()
     if reg_task: reg_task.cancel()
+    if bridge_service.http_client and not bridge_service.http_client.is_closed:
+        await bridge_service.http_client.aclose()
     await bridge_service.oracle_client.close()
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 templates = Jinja2Templates(directory="src/templates")
 
 app.add_middleware(
@@ -621,6 +1147,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# EVE JSON can carry huge http/fileinfo blobs - refuse them before pydantic
+# spends CPU parsing a body we'd reject anyway
+MAX_ALERT_BODY = 64 * 1024
+
+@app.middleware("http")
+async def alert_size_gate(request: Request, call_next):
+    if request.url.path == "/alerts" or request.url.path.startswith("/api/v1/alerts"):
+        content_length = request.headers.get("content-length")
+        if content_length and int(content_length) > MAX_ALERT_BODY:
+            return Response(status_code=413)
+    return await call_next(request)
+
 @app.get("/", response_class=HTMLResponse)
 async def sentry_portal(request: Request):
     return templates.TemplateResponse("index.html", {
@@ -630,7 +1168,11 @@ async def sentry_portal(request: Request):
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
-    services = {s: await bridge_service.check_service_health(s) for s in ["zeek", "kitnet", "bridge"]}
+    # Run per-service checks concurrently so total latency is max() not sum()
+    service_names = ("zeek", "kitnet", "bridge")
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(bridge_service.check_service_health(s)) for s in service_names]
+    services = dict(zip(service_names, (t.result() for t in tasks)))
     return HealthResponse(
         status="healthy",
         timestamp=datetime.now().isoformat(),
@@ -639,101 +1181,83 @@ async def health_check():
     )
 
 @app.post("/alerts", status_code=status.HTTP_201_CREATED)
-async def submit_alert(alert_request: AlertRequest, background_tasks: BackgroundTasks):
+async def submit_alert(alert_request: AlertRequest):
     try:
         alert = bridge_service.add_alert(alert_request)
-        background_tasks.add_task(escalate_to_oracle, alert_request.model_dump())
+        bridge_service.enqueue_escalation(alert_request.model_dump())
         return {"status": "accepted", "alert_id": alert.id}
     except Exception as e:
         logger.error(f"Alert injection failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/alerts/internal", status_code=status.HTTP_201_CREATED)
+async def submit_alert_internal(request: Request):
+    """
+    Trusted fast-path for internal Sentry services (KitNET, log processors).
+    Skips pydantic validation via model_construct - the payload shape is
+    controlled by our own services, so schema checks are redundant here.
+    External callers should keep using POST /alerts.
+    """
+    try:
+        data = orjson.loads(await request.body())
+        alert_request = AlertRequest.model_construct(**data)
+        alert = bridge_service.add_alert(alert_request)
+        # Reuse the parsed dict - no pydantic dump needed on the trusted path
+        bridge_service.enqueue_escalation(data)
+        return {"status": "accepted", "alert_id": alert.id}
+    except Exception as e:
+        logger.error(f"Internal alert injection failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/v1/alerts/suricata", status_code=status.HTTP_201_CREATED)
-async def submit_suricata_alert(alert_request: SuricataAlertRequest, background_tasks: BackgroundTasks):
+async def submit_suricata_alert(alert_request: SuricataAlertRequest):
     """
     Dedicated endpoint for Suricata EVE JSON alerts.
     Handles Suricata's native format with MITRE ATT&CK enrichment.
     """
     try:
-        alert_info = alert_request.alert
-        network_info = alert_request.network
-        
-        # Map Suricata severity (1=high, 2=medium, 3=low) to our format
-        suri_severity = alert_info.get("severity", 3)
-        severity_map = {1: "critical", 2: "high", 3: "medium", 4: "low"}
-        severity = severity_map.get(suri_severity, "medium")
-        
-        # Extract MITRE technique from category
-        category = alert_info.get("category", "Unknown")
-        mitre_technique = SURICATA_CATEGORY_TO_MITRE.get(category)
-        
-        # Build description with context
-        signature = alert_info.get("signature", "Unknown signature")
-        src_ip = network_info.get("src_ip", "unknown")
-        dest_ip = network_info.get("dest_ip", "unknown")
-        dest_port = network_info.get("dest_port", "")
-        protocol = network_info.get("protocol", "TCP")
-        
-        description = f"{signature} | {src_ip} → {dest_ip}:{dest_port} ({protocol})"
-        if mitre_technique:
-            description += f" [MITRE: {mitre_technique}]"
-        
-        # Build raw_data with all available context
-        raw_data = {
-            "signature_id": alert_info.get("signature_id"),
-            "signature": signature,
-            "category": category,
-            "src_ip": src_ip,
-            "dest_ip": dest_ip,
-            "src_port": network_info.get("src_port"),
-            "dest_port": dest_port,
-            "protocol": protocol,
-            "flow_id": alert_request.flow_id,
-            "mitre_technique": mitre_technique,
-        }
-        
-        # Add protocol-specific context if available
-        if alert_request.http:
-            raw_data["http"] = alert_request.http
-        if alert_request.dns:
-            raw_data["dns"] = alert_request.dns
-        if alert_request.tls:
-            raw_data["tls"] = alert_request.tls
-        if alert_request.fileinfo:
-            raw_data["fileinfo"] = alert_request.fileinfo
-        
-        # Create normalized alert
-        normalized = AlertRequest(
+        severity, category, mitre_technique, signature, description, raw_data, confidence = \
+            _build_normalized_suricata(
+                alert_request.alert, alert_request.network, alert_request.flow_id,
+                alert_request.http, alert_request.dns, alert_request.tls, alert_request.fileinfo,
+            )
+
+        # Create normalized alert (model_construct: fields were just built above,
+        # and the escalation payload reuses them without a model_dump walk)
+        normalized = AlertRequest.model_construct(
             source="suricata",
             severity=severity,
             event_type="ids_alert",
             description=description,
             raw_data=raw_data,
-            confidence=0.95 if suri_severity <= 2 else 0.7
+            confidence=confidence
         )
-        
+
         alert = bridge_service.add_alert(normalized)
+
+        # Update Suricata stats (single coalesced increment; flushed every 100ms)
+        bridge_service._pending_suricata[(severity, category, mitre_technique)] += 1
         
-        # Update Suricata stats
-        bridge_service.suricata_stats["alerts_received"] += 1
-        bridge_service.suricata_stats["by_severity"][severity] = \
-            bridge_service.suricata_stats["by_severity"].get(severity, 0) + 1
-        bridge_service.suricata_stats["by_category"][category] = \
-            bridge_service.suricata_stats["by_category"].get(category, 0) + 1
-        
-        if mitre_technique:
-            bridge_service.suricata_stats["mitre_techniques"][mitre_technique] = \
-                bridge_service.suricata_stats["mitre_techniques"].get(mitre_technique, 0) + 1
-        
-        # Track recent signatures (keep last 20 unique)
-        if signature not in bridge_service.suricata_stats["recent_signatures"]:
-            bridge_service.suricata_stats["recent_signatures"].append(signature)
-            if len(bridge_service.suricata_stats["recent_signatures"]) > 20:
-                bridge_service.suricata_stats["recent_signatures"].pop(0)
+        # Track recent signatures (keep last 20 unique, O(1) membership + eviction)
+        if signature not in bridge_service._recent_sig_set:
+            recent = bridge_service.suricata_stats["recent_signatures"]
+            if len(recent) == recent.maxlen:
+                bridge_service._recent_sig_set.discard(recent[0])
+            recent.append(signature)
+            bridge_service._recent_sig_set.add(signature)
         
-        # Auto-escalate high/critical to Oracle
+        # Auto-escalate high/critical to Oracle, deduping repeats of the same flow
         if severity in ("critical", "high"):
-            background_tasks.add_task(escalate_to_oracle, normalized.model_dump())
+            agg_key = (raw_data["signature_id"], raw_data["src_ip"],
+                       raw_data["dest_ip"], raw_data["dest_port"])
+            bridge_service.enqueue_suricata_escalation(agg_key, {
+                "source": "suricata",
+                "severity": severity,
+                "event_type": "ids_alert",
+                "description": description,
+                "raw_data": raw_data,
+                "confidence": confidence,
+            })
         
         # Sanitize log output to prevent log injection
         safe_signature = signature[:50].replace('\n', ' ').replace('\r', ' ')
@@ -748,6 +1272,7 @@ async def submit_suricata_alert(alert_request: SuricataAlertRequest, background_
 @app.get("/api/suricata-stats")
 async def get_suricata_stats():
     """Returns Suricata alert statistics and MITRE coverage"""
+    bridge_service.flush_suricata_stats()  # Include not-yet-flushed increments
     stats = bridge_service.suricata_stats
     return {
         "total_alerts": stats["alerts_received"],
@@ -755,46 +1280,79 @@ async def get_suricata_stats():
         "by_category": stats["by_category"],
         "mitre_techniques": stats["mitre_techniques"],
         "recent_signatures": stats["recent_signatures"],
-        "last_check": datetime.now().isoformat()
+        "last_check": bridge_service._now_dt
     }
 
 # --- KITNET STATS ENDPOINT ---
 
-# KitNET statistics storage
-kitnet_stats = {
-    "last_report": None,
-    "phase": "unknown",
-    "training_progress": 0.0,
-    "total_processed": 0,
-    "anomalies_detected": 0,
-    "uptime_seconds": 0,
-    "num_autoencoders": 0,
-    "feature_groups": 0,
-    "adaptive_threshold": 0.95,
-}
+# KitNET statistics storage - slots keep it a fixed-field struct with
+# attribute access instead of per-key dict lookups
+@dataclass(slots=True)
+class KitnetStats:
+    last_report: Optional[datetime] = None
+    phase: str = "unknown"
+    training_progress: float = 0.0
+    total_processed: int = 0
+    anomalies_detected: int = 0
+    uptime_seconds: int = 0
+    num_autoencoders: int = 0
+    feature_groups: int = 0
+    adaptive_threshold: float = 0.95
+
+    def update(self, data: dict[str, Any]):
+        for key in self.__slots__:
+            if key in data:
+                setattr(self, key, data[key])
+
+    def to_dict(self) -> dict[str, Any]:
+        total = self.total_processed
+        return {
+            "last_report": self.last_report,
+            "phase": self.phase,
+            "training_progress": self.training_progress,
+            "total_processed": total,
+            "anomalies_detected": self.anomalies_detected,
+            "uptime_seconds": self.uptime_seconds,
+            "num_autoencoders": self.num_autoencoders,
+            "feature_groups": self.feature_groups,
+            "adaptive_threshold": self.adaptive_threshold,
+            "detection_rate": self.anomalies_detected / total if total > 0 else 0,
+            "status": "training" if self.phase != "DETECT" else "active",
+        }
+
+kitnet_stats = KitnetStats()
+
+def _encode_kitnet_response() -> bytes:
+    """Serialize the kitnet-stats GET payload once, on the producer side."""
+    return orjson.dumps(kitnet_stats.to_dict())
+
+_kitnet_response_bytes = _encode_kitnet_response()
+_kitnet_version = 0
+_kitnet_etag = '"0"'
 
 @app.post("/api/kitnet-stats")
 async def receive_kitnet_stats(data: dict):
     """Receives periodic stats from KitNET service"""
-    global kitnet_stats
+    global _kitnet_response_bytes, _kitnet_version, _kitnet_etag
     kitnet_stats.update(data)
-    kitnet_stats["last_report"] = datetime.now().isoformat()
+    # Raw datetime - orjson serializes it natively, no isoformat() allocation
+    kitnet_stats.last_report = bridge_service._now_dt
+    # Re-serialize here so every poll below serves the same cached bytes
+    _kitnet_response_bytes = _encode_kitnet_response()
+    _kitnet_version += 1
+    _kitnet_etag = f'"{_kitnet_version}"'
     # Sanitize log output - only log numeric value to prevent log injection
     total_processed = int(data.get('total_processed', 0)) if isinstance(data.get('total_processed'), (int, float)) else 0
     logger.debug(f"🤖 KitNET stats updated: {total_processed} processed")
     return {"status": "ok"}
 
 @app.get("/api/kitnet-stats")
-async def get_kitnet_stats():
-    """Returns KitNET AI detection statistics"""
-    return {
-        **kitnet_stats,
-        "detection_rate": (
-            kitnet_stats["anomalies_detected"] / kitnet_stats["total_processed"]
-            if kitnet_stats["total_processed"] > 0 else 0
-        ),
-        "status": "training" if kitnet_stats["phase"] != "DETECT" else "active",
-    }
+async def get_kitnet_stats(request: Request):
+    """Returns KitNET AI detection statistics (pre-serialized on update)"""
+    if request.headers.get("if-none-match") == _kitnet_etag:
+        return Response(status_code=304, headers={"ETag": _kitnet_etag})
+    return Response(content=_kitnet_response_bytes, media_type="application/json",
+                    headers={"ETag": _kitnet_etag})
 
 @app.get("/api/discovery")
 async def discovery_endpoint():
@@ -806,17 +1364,57 @@ async def update_score(data: dict):
     """Fixes KitNET 404 by providing the endpoint it's targeting"""
     score = data.get("score", 0.0)
     bridge_service.local_stats["anomaly_score"] = score
+    bridge_service.mark_stats_dirty()
     return {"status": "ok"}
 
 @app.get("/alerts")
-async def get_alerts(limit: int = 100):
-    return {"total": len(bridge_service.alerts), "alerts": [asdict(a) for a in bridge_service.alerts[-limit:]]}
+async def get_alerts(request: Request, limit: int = 100):
+    etag = f'"{bridge_service.alerts_version}-{limit}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    # islice the deque tail instead of copying all 5000 entries per request;
+    # each alert was serialized on insert, so streaming is a pure bytes relay
+    # with peak memory independent of limit
+    n = len(bridge_service._alert_json)
+    tail = list(itertools.islice(bridge_service._alert_json, max(0, n - limit), n))
+
+    async def stream_alerts():
+        yield b'{"total":%d,"alerts":[' % n
+        first = True
+        for item in tail:
+            yield item if first else b"," + item
+            first = False
+        yield b"]}"
+
+    return StreamingResponse(stream_alerts(), media_type="application/json", headers={"ETag": etag})
 
 @app.get("/api/local-stats")
 async def get_local_stats():
-    return bridge_service.local_stats
+    # mark_stats_dirty() keeps these bytes current - serve them as-is
+    return Response(content=bridge_service._stats_bytes, media_type="application/json")
+
+@app.get("/api/local-stats/stream")
+async def stream_local_stats():
+    """SSE stream of local stats - pushes only when stats change (no polling)"""
+    async def event_generator():
+        # Own wakeup event: updates arriving while this subscriber is still
+        # yielding leave it set, so the next wait() returns immediately and
+        # a burst can never be consumed away before we observe it
+        dirty = asyncio.Event()
+        bridge_service._stats_listeners.add(dirty)
+        try:
+            # Send current snapshot immediately, then only on change
+            yield b"data: " + bridge_service._stats_bytes + b"\n\n"
+            while True:
+                await dirty.wait()
+                dirty.clear()
+                yield b"data: " + bridge_service._stats_bytes + b"\n\n"
+        finally:
+            bridge_service._stats_listeners.discard(dirty)
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
 
 @app.get("/api/zeek-notices")
+@ttl_cache(seconds=2)
 async def get_zeek_notice_stats():
     """Returns Zeek notice monitoring statistics and recent notices"""
     stats = zeek_notice_monitor.get_stats()
@@ -826,34 +1424,41 @@ async def get_zeek_notice_stats():
         "by_type": stats["by_type"],
         "by_severity": stats["by_severity"],
         "mitre_coverage": len([k for k, v in stats["by_type"].items() if v > 0]),
-        "last_check": datetime.now().isoformat()
+        "last_check": bridge_service._now_dt
     }
 
 # --- SETUP MODE / DEVICE AUTHORIZATION ENDPOINTS ---
 
 @app.get("/api/setup/status")
-async def get_setup_status():
-    """Returns the current setup status."""
-    return bridge_service.get_setup_status()
+async def get_setup_status(request: Request):
+    """Returns the current setup status (cached bytes, rebuilt on mutation)."""
+    etag = f'"{bridge_service._status_version}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    if bridge_service._status_cache_bytes is None:
+        bridge_service._status_cache_bytes = orjson.dumps(bridge_service.get_setup_status())
+    return Response(content=bridge_service._status_cache_bytes, media_type="application/json",
+                    headers={"ETag": etag})
 
 @app.post("/api/setup/reset")
 async def reset_setup():
     """Resets sentry to setup mode, clearing all connections."""
     try:
-        if bridge_service.config_path.exists():
-            bridge_service.config_path.unlink()
-        
-        # Clear accounts file
-        accounts_file = DATA_DIR / "connected_accounts.json"
-        if accounts_file.exists():
-            accounts_file.unlink()
-        
+        await asyncio.to_thread(bridge_service.config_path.unlink, missing_ok=True)
+
+        # Clear accounts file and drop the in-memory cache with it
+        await asyncio.to_thread(ACCOUNTS_FILE.unlink, missing_ok=True)
+        _accounts_cache["mtime"] = -1.0
+        _accounts_cache["data"] = None
+        _accounts_cache["placeholder"] = None
+
         bridge_service.sentry_id = bridge_service.hardware_id
         bridge_service.api_key = None
         bridge_service.is_setup_mode = True
         bridge_service.connected_devices_count = 0
         bridge_service.claim_token = None
-        
+        bridge_service.invalidate_status_cache()
+
         bridge_service.oracle_client.update_api_key(None)
         
         # Re-register with Oracle to get a new claim token
@@ -866,9 +1471,9 @@ async def reset_setup():
             "claim_token": bridge_service.claim_token or "Registering..."
         }
     except Exception as e:
-        logger.error(f"❌ Reset failed: {e}")
-        import traceback
-        traceback.print_exc()
+        # logger.exception captures the traceback through the logging
+        # handlers instead of a blocking sync write to stderr
+        logger.exception("❌ Reset failed")
         raise HTTPException(status_code=500, detail=f"Reset failed: {str(e)}")
 
 # --- END SETUP MODE ENDPOINTS ---
@@ -900,9 +1505,7 @@ async def complete_setup(data: dict):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Setup completion failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Setup completion failed")
         raise HTTPException(status_code=500, detail=f"Setup failed: {str(e)}")
 
 # --- ACCOUNTS MANAGEMENT ---
@@ -912,75 +1515,130 @@ ACCOUNTS_FILE = DATA_DIR / "connected_accounts.json"
 NICKNAME_ADJECTIVES = ["Swift", "Bright", "Silent", "Cosmic", "Noble", "Mystic", "Rapid", "Golden", "Shadow", "Crystal", "Thunder", "Velvet", "Arctic", "Solar", "Lunar"]
 NICKNAME_NOUNS = ["Phoenix", "Falcon", "Panther", "Dragon", "Wolf", "Hawk", "Tiger", "Eagle", "Raven", "Viper", "Lynx", "Cobra", "Jaguar", "Orca", "Fox"]
 
+# All 225 adjective/noun combos, built once - lets us pick an unused name
+# directly instead of retrying random draws against a list
+_ALL_COMBOS = tuple(f"{a} {n}" for a in NICKNAME_ADJECTIVES for n in NICKNAME_NOUNS)
+
 def generate_nickname(existing_nicknames: list[str]) -> str:
     """Generate unique two-word nickname"""
-    import random
-    for _ in range(100):
-        name = f"{random.choice(NICKNAME_ADJECTIVES)} {random.choice(NICKNAME_NOUNS)}"
-        if name not in existing_nicknames:
-            return name
+    existing = set(existing_nicknames)
+    name = random.choice(_ALL_COMBOS)
+    if name not in existing:
+        return name
+    available = [c for c in _ALL_COMBOS if c not in existing]
+    if available:
+        return random.choice(available)
     return f"Account {random.randint(1000, 9999)}"
 
-def load_accounts() -> list:
-    """Load connected accounts from file"""
-    if ACCOUNTS_FILE.exists():
-        try:
-            return json.loads(ACCOUNTS_FILE.read_text())
-        except:
-            pass
+# Accounts cache: re-parse only when the file mtime changes (endpoints are
+# polled, the file changes rarely - each hit becomes a single stat() syscall).
+# "placeholder" holds the synthetic claimed-but-no-file account, built once
+# so repeat polls serve one stable representation.
+_accounts_cache: dict[str, Any] = {"mtime": -1.0, "data": None, "placeholder": None}
+
+def load_accounts() -> tuple[str, list]:
+    """Load connected accounts, returning (etag, accounts).
+
+    Every branch stamps its own ETag so the tag always moves with the data
+    being served: the file path uses the mtime, the fallbacks use distinct
+    markers. (Deriving the tag from the cached mtime alone left it frozen
+    at -1.0 while the payload flipped between empty and the placeholder,
+    feeding clients wrong 304s.)
+    """
+    try:
+        mtime = ACCOUNTS_FILE.stat().st_mtime
+        if mtime == _accounts_cache["mtime"]:
+            return f'"{mtime}"', _accounts_cache["data"]
+        accounts = orjson.loads(ACCOUNTS_FILE.read_bytes())
+        _accounts_cache["mtime"] = mtime
+        _accounts_cache["data"] = accounts
+        return f'"{mtime}"', accounts
+    except (OSError, orjson.JSONDecodeError):
+        pass
     if bridge_service.api_key:
-        return [{"id": "1", "nickname": "Swift Phoenix", "account_number": "ORCxxxx", "connected_at": datetime.now().isoformat()}]
-    return []
+        if _accounts_cache["placeholder"] is None:
+            connected_at = datetime.now(timezone.utc).isoformat()
+            _accounts_cache["placeholder"] = [{"id": "1", "nickname": "Swift Phoenix", "account_number": "ORCxxxx", "connected_at": connected_at}]
+        return '"placeholder"', _accounts_cache["placeholder"]
+    return '"empty"', []
 
 def save_accounts(accounts: list):
     """Save accounts to file"""
     ACCOUNTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    ACCOUNTS_FILE.write_text(json.dumps(accounts, indent=2))
+    ACCOUNTS_FILE.write_bytes(orjson.dumps(accounts, option=orjson.OPT_INDENT_2))
+    # Refresh the cache so the next read doesn't re-parse what we just wrote
+    try:
+        _accounts_cache["mtime"] = ACCOUNTS_FILE.stat().st_mtime
+        _accounts_cache["data"] = accounts
+    except OSError:
+        _accounts_cache["mtime"] = -1.0
+    # Account count feeds the setup-status payload
+    bridge_service.invalidate_status_cache()
 
 @app.get("/api/accounts")
-async def get_accounts():
+async def get_accounts(request: Request):
     """Get list of connected Oracle accounts"""
-    return load_accounts()
+    etag, accounts = await asyncio.to_thread(load_accounts)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return ORJSONResponse(accounts, headers={"ETag": etag})
 
 @app.patch("/api/accounts/{account_id}")
 async def update_account(account_id: str, request: Request):
     """Update account nickname"""
     data = await request.json()
-    accounts = load_accounts()
+    _etag, accounts = await asyncio.to_thread(load_accounts)
     for acc in accounts:
         if acc.get("id") == account_id:
             if "nickname" in data:
                 acc["nickname"] = data["nickname"][:30]
             break
-    save_accounts(accounts)
+    await asyncio.to_thread(save_accounts, accounts)
     return {"status": "updated"}
 
 @app.delete("/api/accounts/{account_id}")
 async def remove_account(account_id: str):
     """Remove an Oracle account connection"""
-    accounts = load_accounts()
-    accounts = [a for a in accounts if a.get("id") != account_id]
-    save_accounts(accounts)
-    
-    if len(accounts) == 0:
+    _etag, accounts = await asyncio.to_thread(load_accounts)
+    remaining = [a for a in accounts if a.get("id") != account_id]
+
+    if len(remaining) == 0:
+        # reset_setup unlinks the accounts file anyway - don't write it first
         await reset_setup()
-    
+    else:
+        await asyncio.to_thread(save_accounts, remaining)
+
     return {"status": "removed"}
 
 @app.post("/api/setup/add-account")
 async def add_account():
     """Generate new pairing code for additional account"""
     await bridge_service.register_with_oracle()
-    return {
+    return ORJSONResponse({
         "claim_token": bridge_service.claim_token or "Registering...",
         "message": "Enter this code in your Oracle dashboard"
-    }
+    })
 
 # --- DEVICE INFO ---
 
-@app.get("/api/device-info")
-async def get_device_info():
-    """Get device hardware stats"""
+# Single-pass /proc/meminfo extraction (MemAvailable follows MemTotal)
+_MEMINFO_RE = re.compile(rb"MemTotal:\s+(\d+).*?MemAvailable:\s+(\d+)", re.S)
+
+# Thermal zone either exists on this hardware or never will for the process
+# lifetime - check once instead of a stat() per request
+_THERMAL = "/sys/class/thermal/thermal_zone0/temp"
+_THERMAL_OK = Path(_THERMAL).exists()
+
+def _read_procfile(path: str, size: int = 4096) -> bytes:
+    """One read() of a proc/sys pseudo-file - no TextIOWrapper, no decoding."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+def _collect_device_info() -> dict[str, Any]:
+    """Gather hardware stats with synchronous reads (run off the event loop)."""
     info = {
         "hardware_id": bridge_service.hardware_id,
         "version": "1.0.0",
@@ -992,47 +1650,45 @@ async def get_device_info():
     
     try:
         # CPU Temperature (Raspberry Pi / Linux)
-        temp_file = Path("/sys/class/thermal/thermal_zone0/temp")
-        if temp_file.exists():
-            temp = int(temp_file.read_text().strip()) / 1000
+        if _THERMAL_OK:
+            temp = int(_read_procfile(_THERMAL, 64)) / 1000
             info["cpu_temp"] = round(temp, 1)
-    except:
+    except (OSError, ValueError):
         pass
     
     try:
-        # Memory usage
-        with open("/proc/meminfo") as f:
-            lines = f.readlines()
-            total = int([l for l in lines if "MemTotal" in l][0].split()[1])
-            avail = int([l for l in lines if "MemAvailable" in l][0].split()[1])
+        # Memory usage - one read, one regex pass (no per-line list scans)
+        match = _MEMINFO_RE.search(_read_procfile("/proc/meminfo"))
+        if match:
+            total, avail = int(match.group(1)), int(match.group(2))
             info["memory_percent"] = round((1 - avail/total) * 100, 1)
-    except:
+    except (OSError, ValueError):
         pass
     
     try:
         # Disk usage
-        import shutil
         usage = shutil.disk_usage("/")
         info["disk_percent"] = round(usage.used / usage.total * 100, 1)
-    except:
+    except (OSError, ValueError):
         pass
     
     try:
-        # Uptime
-        with open("/proc/uptime") as f:
-            uptime_seconds = float(f.read().split()[0])
-            days = int(uptime_seconds // 86400)
-            hours = int((uptime_seconds % 86400) // 3600)
-            if days > 0:
-                info["uptime"] = f"{days}d {hours}h"
-            else:
-                mins = int((uptime_seconds % 3600) // 60)
-                info["uptime"] = f"{hours}h {mins}m"
-    except:
+        # Uptime - only the first field is needed
+        uptime_seconds = float(_read_procfile("/proc/uptime", 64).partition(b" ")[0])
+        days, rem = divmod(int(uptime_seconds), 86400)
+        hours, rem = divmod(rem, 3600)
+        info["uptime"] = f"{days}d {hours}h" if days else f"{hours}h {rem // 60}m"
+    except (OSError, ValueError):
         pass
-    
+
     return info
 
+@app.get("/api/device-info")
+@ttl_cache(seconds=5)
+async def get_device_info():
+    """Get device hardware stats"""
+    return await asyncio.to_thread(_collect_device_info)
+
 
 # --- COMMAND EXECUTION WITH SAFEGUARDS ---
 
@@ -1084,7 +1740,6 @@ class ExecuteResponse(BaseModel):
 
 def is_valid_ip(ip: str) -> bool:
     """Validate IP address format"""
-    import re
     pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
     if not re.match(pattern, ip):
         return False
@@ -1176,4 +1831,4 @@ async def execute_command(request: ExecuteRequest):
 
 if __name__ == "__main__":
     port = int(os.getenv("BRIDGE_PORT", "8001"))
-    uvicorn.run("bridge_service:app", host="0.0.0.0", port=port, reload=True)
\ No newline at end of file
+    uvicorn.run("bridge_service:app", host="0.0.0.0", port=port, loop="uvloop", http="httptools", reload=True)
\ No newline at end of file
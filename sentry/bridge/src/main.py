@@ -20,21 +20,26 @@ logger = logging.getLogger(__name__)
 
 if __name__ == "__main__":
     import uvicorn
-    
-    # Import our comprehensive bridge service
-    from bridge_service import app
-    
+
     # Configuration from environment
     host = os.getenv("BRIDGE_HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8001"))  # Use port 8001 to match docker-compose
     debug = os.getenv("DEV_MODE", "false").lower() == "true"
-    
-    logger.info(f"🚀 Starting Cardea Bridge Service on {host}:{port}")
+    # CPU scale-out: one event loop per core. Note that stats/alert buffers are
+    # per-worker with workers > 1 - keep the default of 1 unless ingestion is
+    # CPU-bound and per-worker stats are acceptable.
+    workers = int(os.getenv("BRIDGE_WORKERS", "1"))
+
+    logger.info(f"🚀 Starting Cardea Bridge Service on {host}:{port} ({workers} worker(s))")
     logger.info(f"Debug mode: {debug}")
-    
+
     uvicorn.run(
-        app,
+        "bridge_service:app",  # Import string required for multi-worker mode
         host=host,
         port=port,
-        log_level="info" if not debug else "debug"
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        log_level="info" if not debug else "debug",
+        access_log=debug  # per-request log formatting is a measurable tax
     )
\ No newline at end of file
@@ -7,7 +7,12 @@ Handles communication with Oracle cloud service
 import asyncio
 import logging
 import os
+import re
+import socket
+import time
 import aiohttp
+import orjson
+from collections import deque
 from typing import Any, Dict, Optional
 from datetime import datetime
 from pathlib import Path
@@ -23,7 +28,42 @@ class OracleClient:
         self.session: Optional[aiohttp.ClientSession] = None
         self.connection_attempts = 0
         self.last_successful_ping = None
-        
+        self._start_lock = asyncio.Lock()
+        # Outbound alerts are queued and drained in batches by _flusher so a
+        # burst costs one round-trip per ~32 alerts instead of one each
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        self._flusher_task: Optional[asyncio.Task] = None
+        # Serialize heartbeats so overlapping timers can't stampede the pool
+        self._heartbeat_sem = asyncio.Semaphore(1)
+
+    # Batch up to this many alerts per flush window
+    FLUSH_BATCH_MAX = 32
+    FLUSH_WINDOW = 0.05  # seconds
+
+    async def start(self):
+        """
+        Create the shared pooled session and start the outbox flusher.
+        Called once from the FastAPI lifespan at startup; idempotent and
+        safe against concurrent bootstrap.
+        """
+        async with self._start_lock:
+            if self.session is None or self.session.closed:
+                self.session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=32,
+                        limit_per_host=16,
+                        ttl_dns_cache=300,
+                        use_dns_cache=True,
+                        enable_cleanup_closed=True,
+                        keepalive_timeout=75,
+                        # Oracle is IPv4-only; skip the dual-stack resolver dance
+                        family=socket.AF_INET
+                    ),
+                    timeout=aiohttp.ClientTimeout(total=30, connect=5)
+                )
+            if self._flusher_task is None or self._flusher_task.done():
+                self._flusher_task = asyncio.create_task(self._flusher())
+
     def update_api_key(self, new_key: str):
         """Update API key dynamically (e.g. after claiming)"""
         self.api_key = new_key
@@ -39,13 +79,6 @@ class OracleClient:
             headers["X-Sentry-API-Key"] = self.api_key
         return headers
 
-    async def _ensure_session(self):
-        """Ensure HTTP session exists"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30)
-            )
-
     # --- DEVICE MANAGEMENT ENDPOINTS ---
 
     async def register_device(self, hardware_id: str, version: str = "1.0.0", device_type: str = "sentry_pi") -> Dict[str, Any]:
@@ -61,7 +94,6 @@ class OracleClient:
         }
         
         try:
-            await self._ensure_session()
             async with self.session.post(endpoint, json=payload) as response:
                 if response.status in (200, 201):
                     data = await response.json()
@@ -94,17 +126,17 @@ class OracleClient:
         }
         
         try:
-            await self._ensure_session()
-            async with self.session.post(endpoint, headers=headers) as response:
-                if response.status == 200:
-                    self.last_successful_ping = datetime.now()
-                    return True
-                elif response.status == 403:
-                    logger.warning("❌ Heartbeat rejected: Invalid Credentials. Device may have been reset.")
-                    return False
-                else:
-                    logger.warning(f"Heartbeat failed: {response.status}")
-                    return False
+            async with self._heartbeat_sem:
+                async with self.session.post(endpoint, headers=headers) as response:
+                    if response.status == 200:
+                        self.last_successful_ping = datetime.now()
+                        return True
+                    elif response.status == 403:
+                        logger.warning("❌ Heartbeat rejected: Invalid Credentials. Device may have been reset.")
+                        return False
+                    else:
+                        logger.warning(f"Heartbeat failed: {response.status}")
+                        return False
         except Exception as e:
             logger.error(f"Heartbeat error: {e}")
             return False
@@ -119,10 +151,13 @@ class OracleClient:
 
         logger.warning(f"🚨 Escalating anomaly to Oracle: score={alert_data.get('anomaly_score', 0):.4f}")
         
-        # Collect evidence snapshot for the IP
-        evidence_snapshot = await self._collect_evidence_snapshot(
-            alert_data.get('network', {}).get('src_ip')
-        )
+        # Collect evidence snapshot for the IP - skip the coroutine round
+        # trip entirely when there is no IP to look up
+        src_ip = alert_data.get('network', {}).get('src_ip')
+        if src_ip:
+            evidence_snapshot = await self._collect_evidence_snapshot(src_ip)
+        else:
+            evidence_snapshot = {"target_ip": None, "zeek_logs": [], "log_entries_found": 0}
         
         escalation_data = {
             "source": "bridge",
@@ -134,8 +169,8 @@ class OracleClient:
             "raw_data": alert_data,
             "evidence": evidence_snapshot
         }
-        
-        await self._send_to_oracle(escalation_data)
+
+        self._enqueue(escalation_data)
     
     async def send_priority_alert(self, alert_data: Dict[str, Any]):
         """Send priority alert from Suricata to Oracle"""
@@ -153,8 +188,72 @@ class OracleClient:
             "timestamp": datetime.now().isoformat(),
             "raw_data": alert_data
         }
-        
-        await self._send_to_oracle(priority_data)
+
+        self._enqueue(priority_data)
+
+    def _enqueue(self, data: Dict[str, Any]):
+        """Queue an alert for the batching flusher; drop with a log on overflow."""
+        try:
+            self._outbox.put_nowait(data)
+        except asyncio.QueueFull:
+            logger.warning("⚠️ Oracle outbox full - dropping alert")
+
+    async def _flusher(self):
+        """
+        Drain the outbox in small time-boxed batches. A lone alert goes out
+        on the single-alert endpoint; multiple alerts share one bulk POST.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await self._outbox.get()]
+            deadline = loop.time() + self.FLUSH_WINDOW
+            while len(items) < self.FLUSH_BATCH_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(self._outbox.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                if len(items) == 1:
+                    await self._send_to_oracle(items[0])
+                else:
+                    await self._send_bulk_to_oracle(items)
+            finally:
+                for _ in items:
+                    self._outbox.task_done()
+
+    async def _send_bulk_to_oracle(self, items: list):
+        """Send a batch of alerts in one request to the bulk endpoint"""
+        endpoint = f"{self.oracle_url}/api/alerts/bulk"
+
+        try:
+            body = orjson.dumps({"alerts": items}, default=str)
+            async with self.session.post(
+                endpoint,
+                data=body,
+                headers=self._get_headers()
+            ) as response:
+
+                if response.status in (200, 201):
+                    self.last_successful_ping = datetime.now()
+                    self.connection_attempts = 0
+                else:
+                    logger.error(f"❌ Oracle rejected bulk alerts: {response.status}")
+
+        except asyncio.TimeoutError:
+            logger.error("Timeout connecting to Oracle")
+            self.connection_attempts += 1
+
+        except aiohttp.ClientError as e:
+            logger.error(f"Connection error to Oracle: {e}")
+            self.connection_attempts += 1
+
+        except Exception as e:
+            logger.error(f"Unexpected error sending to Oracle: {e}")
+            self.connection_attempts += 1
     
     async def _collect_evidence_snapshot(self, target_ip: str) -> Dict[str, Any]:
         """Collect evidence snapshot from Zeek logs for specific IP"""
@@ -172,20 +271,32 @@ class OracleClient:
             zeek_log_path = Path("/opt/zeek/logs/current/conn.log")
             
             if zeek_log_path.exists():
-                # Read last 1000 lines and find entries for this IP
+                # Keep only the last 1000 lines of the log tail for this IP
                 ip_entries = []
-                
-                with open(zeek_log_path, 'r') as f:
-                    # Get last 1000 lines
-                    lines = f.readlines()[-1000:] if len(f.readlines()) > 1000 else f.readlines()
-                    
+
+                # Anchor the IP to tab field boundaries so "10.0.0.7" cannot
+                # match inside "110.0.0.7" or "10.0.0.70"
+                pat = re.compile(rb'(^|\t)' + re.escape(target_ip.encode()) + rb'(\t|$)')
+
+                with open(zeek_log_path, 'rb', buffering=1 << 16) as f:
+                    # Seek near the end so only the tail is scanned, then
+                    # stream once keeping a bounded window - O(1000) memory
+                    # regardless of how large conn.log has grown
+                    size = os.fstat(f.fileno()).st_size
+                    if size > 256 * 1024:
+                        f.seek(size - 256 * 1024)
+                        f.readline()  # Discard the partial line at the seek point
+                    lines = deque(f, maxlen=1000)
+
                     for line in reversed(lines):  # Start from most recent
-                        if target_ip in line and not line.startswith('#'):
-                            # Parse Zeek log line for human-readable format
-                            parsed_entry = self._parse_zeek_line_for_evidence(line.strip())
+                        if line[:1] != b'#' and pat.search(line):
+                            # Only the handful of matches pay the UTF-8 decode
+                            parsed_entry = self._parse_zeek_line_for_evidence(
+                                line.decode('utf-8', 'replace').strip()
+                            )
                             if parsed_entry:
                                 ip_entries.append(parsed_entry)
-                                
+
                             # Limit to last 5 entries
                             if len(ip_entries) >= 5:
                                 break
@@ -202,19 +313,26 @@ class OracleClient:
     def _parse_zeek_line_for_evidence(self, line: str) -> Dict[str, Any]:
         """Parse Zeek conn.log line into human-readable evidence format"""
         try:
-            fields = line.split('\t')
+            # Only the first 12 fields matter - stop splitting after them
+            # (maxsplit=12 keeps index 11 clean; the remainder lands in [12])
+            fields = line.split('\t', 12)
             if len(fields) < 10:
                 return None
-                
+
+            # Unset-field fallback ('-' placeholder in Zeek TSV)
+            _f = lambda v, d=0: d if v == '-' else v
+
             return {
-                "timestamp": datetime.fromtimestamp(float(fields[0])).strftime("%Y-%m-%d %H:%M:%S"),
+                # time.strftime on a timetuple avoids the datetime object +
+                # bound-method round trip of datetime.fromtimestamp().strftime()
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(float(fields[0]))),
                 "connection": f"{fields[2]}:{fields[3]} -> {fields[4]}:{fields[5]}",
                 "protocol": fields[6],
-                "service": fields[7] if fields[7] != '-' else "unknown",
+                "service": _f(fields[7], "unknown"),
                 "duration": f"{fields[8]}s" if fields[8] != '-' else "N/A",
-                "bytes_sent": int(fields[9]) if fields[9] != '-' else 0,
-                "bytes_received": int(fields[10]) if len(fields) > 10 and fields[10] != '-' else 0,
-                "connection_state": fields[11] if len(fields) > 11 and fields[11] != '-' else "unknown"
+                "bytes_sent": int(_f(fields[9])),
+                "bytes_received": int(_f(fields[10])) if len(fields) > 10 else 0,
+                "connection_state": _f(fields[11], "unknown") if len(fields) > 11 else "unknown"
             }
         except (ValueError, IndexError):
             return None
@@ -224,13 +342,13 @@ class OracleClient:
         endpoint = f"{self.oracle_url}/api/alerts"
         
         try:
-            await self._ensure_session()
-            
+            # Serialize once with orjson (bytes out, no utf-8 re-encode pass)
+            # instead of letting aiohttp run the payload through stdlib json
+            body = orjson.dumps(data, default=str)
             async with self.session.post(
                 endpoint,
-                json=data,
-                headers=self._get_headers(),
-                timeout=aiohttp.ClientTimeout(total=30)
+                data=body,
+                headers=self._get_headers()
             ) as response:
                 
                 if response.status == 200:
@@ -253,6 +371,12 @@ class OracleClient:
             self.connection_attempts += 1
     
     async def close(self):
-        """Close HTTP session"""
-        if self.session:
+        """Flush any queued alerts, then close the HTTP session"""
+        if self._flusher_task and not self._flusher_task.done():
+            try:
+                await asyncio.wait_for(self._outbox.join(), timeout=5)
+            except asyncio.TimeoutError:
+                logger.warning("⚠️ Oracle outbox not fully drained before shutdown")
+            self._flusher_task.cancel()
+        if self.session and not self.session.closed:
             await self.session.close()
\ No newline at end of file
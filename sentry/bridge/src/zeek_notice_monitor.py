@@ -26,6 +26,13 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Optional inotify-based watching - falls back to 1s polling when unavailable
+try:
+    from watchfiles import awatch
+    HAS_WATCHFILES = True
+except ImportError:
+    HAS_WATCHFILES = False
+
 
 @dataclass
 class ZeekNotice:
@@ -183,15 +190,30 @@ class ZeekNoticeMonitor:
                 # Try to find log if we haven't yet
                 if not self.notice_log_path:
                     self.notice_log_path = self._find_notice_log()
-                
+
                 if self.notice_log_path and self.notice_log_path.exists():
+                    if HAS_WATCHFILES:
+                        # Event-driven tail: zero CPU while Zeek is idle
+                        await self._watch_loop()
+                        continue
                     await self._process_notices()
-                
+
                 await asyncio.sleep(1)  # Check every second
-                
+
             except Exception as e:
                 logger.error(f"Notice monitor error: {e}")
                 await asyncio.sleep(5)
+
+    async def _watch_loop(self):
+        """Tail notice.log via inotify - wakes only when Zeek writes."""
+        logger.info("👀 Watching notice.log via inotify (watchfiles)")
+        await self._process_notices()  # Catch up on anything written before the watch
+        async for _changes in awatch(self.notice_log_path):
+            if not self.is_running:
+                break
+            await self._process_notices()
+            if not self.notice_log_path.exists():
+                break  # Log rotated away - fall back to discovery in _monitor_loop
     
     async def _process_notices(self):
         """Process new entries in notice.log."""
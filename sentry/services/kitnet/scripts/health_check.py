@@ -10,32 +10,29 @@ from pathlib import Path
 
 def check_model_health():
     """Check if KitNET model exists and is usable."""
-    model_path = Path('/app/data/kitnet_model.pkl')
-    
+    model_path = Path('/app/data/kitnet_model.npz')
+
     if not model_path.exists():
         return {
             "model_status": "training",
             "healthy": True,
             "message": "Model training in progress"
         }
-    
-    # Check model file integrity
+
+    # Check model file integrity - only the metadata member is decompressed,
+    # the weight arrays are never touched (and allow_pickle=False means no
+    # arbitrary-code-execution risk, unlike the old pickle format)
     try:
-        import pickle
-        with open(model_path, 'rb') as f:
-            data = pickle.load(f)
-        
-        version = data.get('version', 'unknown')
-        phase = data.get('phase', 'unknown')
-        training_samples = data.get('training_samples', 0)
-        num_autoencoders = len(data.get('autoencoders', []))
-        
+        import numpy as np
+        with np.load(model_path, allow_pickle=False) as data:
+            meta = json.loads(data['meta'].item())
+
         return {
             "model_status": "loaded",
-            "phase": phase,
-            "version": version,
-            "training_samples": training_samples,
-            "num_autoencoders": num_autoencoders,
+            "phase": meta.get('phase', 'unknown'),
+            "version": meta.get('version', 'unknown'),
+            "training_samples": meta.get('training_samples', 0),
+            "num_autoencoders": meta.get('num_autoencoders', 0),
             "healthy": True
         }
     except Exception as e:
@@ -6,7 +6,8 @@ Manages alert sending to Bridge service with robust type handling
 
 import logging
 import aiohttp
-from typing import Any, Union
+import orjson
+from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -16,43 +17,58 @@ class AlertManager:
     def __init__(self, bridge_url: str):
         # Clean the URL to ensure no trailing slashes mess up the endpoint
         self.bridge_url = bridge_url.rstrip('/')
+        # Aligns with the alert ingestion endpoint in bridge_service.py
+        self._endpoint = f"{self.bridge_url}/alerts"
         self.alert_count = 0
-        self.session = None
-        
-    async def send_alert(self, score_data: Union[float, dict[str, Any]], packet_info: dict[str, Any] = None):
+        self._session: aiohttp.ClientSession = None
+        # Bounded keep-alive pool - one TCP handshake per connection, not per alert
+        self._connector_kwargs = dict(limit=32, limit_per_host=16, ttl_dns_cache=300, keepalive_timeout=75)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared pooled session, recreating it if it was closed."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self._connector_kwargs),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def send_alert(self, score: float, packet_info: Optional[dict[str, Any]] = None):
         """
         Send formatted alert to Bridge service.
-        Handles cases where score might be wrapped in a dictionary to prevent TypeErrors.
+        Callers pass the anomaly score as a plain float; dict unwrapping
+        happens at the detector, not here.
         """
+        # Construct payload to match bridge_service.py AlertRequest schema
+        alert_payload = {
+            "source": "kitnet",
+            "severity": "high" if score > 0.9 else "medium",
+            "event_type": "network_anomaly",
+            "description": f"AI detected anomaly with score {score:.4f}",
+            "raw_data": {
+                "anomaly_score": score,
+                "packet_info": packet_info or {}
+            },
+            "confidence": 0.95
+        }
+
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
-            
-            # Extract the actual float value from the data passed by KitNET
-            if isinstance(score_data, dict):
-                # If it's a dict, try to find 'score' or 'anomaly_score'
-                score = float(score_data.get("score", score_data.get("anomaly_score", 0.0)))
-            else:
-                # If it's already a number or string, convert directly
-                score = float(score_data)
+            session = await self._get_session()
 
-            # Align with the endpoint in bridge_service.py
-            endpoint = f"{self.bridge_url}/alerts"
-            
-            # Construct payload to match bridge_service.py AlertRequest schema
-            alert_payload = {
-                "source": "kitnet",
-                "severity": "high" if score > 0.9 else "medium",
-                "event_type": "network_anomaly",
-                "description": f"AI detected anomaly with score {score:.4f}",
-                "raw_data": {
-                    "anomaly_score": score,
-                    "packet_info": packet_info or {}
-                },
-                "confidence": 0.95
-            }
-            
-            async with self.session.post(endpoint, json=alert_payload) as response:
+            # orjson serializes straight to bytes, skipping aiohttp's stdlib
+            # json encoder on the hot path
+            async with session.post(
+                self._endpoint,
+                data=orjson.dumps(alert_payload),
+                headers={"Content-Type": "application/json"}
+            ) as response:
                 # The bridge_service returns 201 Created for new alerts
                 if response.status in [200, 201]:
                     self.alert_count += 1
@@ -70,5 +86,5 @@ class AlertManager:
     
     async def close(self):
         """Close HTTP session"""
-        if self.session:
-            await self.session.close()
\ No newline at end of file
+        if self._session and not self._session.closed:
+            await self._session.close()
\ No newline at end of file
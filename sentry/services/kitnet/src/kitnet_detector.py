@@ -14,116 +14,183 @@ This implementation includes:
 """
 
 import numpy as np
-import pickle
+import json
 import logging
 import math
 from pathlib import Path
 from typing import Optional, Any
 from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import MiniBatchKMeans
+from scipy.cluster.hierarchy import linkage, fcluster
+from scipy.spatial.distance import squareform
 from datetime import datetime
-from collections import deque
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Categorical encodings used by extract_features. Built once at import time
+# instead of per call; the lru_cache wrappers also amortize the str()/case
+# normalization since real traffic cycles through a handful of raw values.
+_PROTO_MAP = {"tcp": 0.2, "udp": 0.4, "icmp": 0.6, "sctp": 0.8}
+
+# Zero fill for the DNS+HTTP+SSL feature span when a packet has none of them
+_ZEROS_20 = np.zeros(20, dtype=np.float32)
+
+# Normalization lookup tables - ports cover their whole 16-bit domain, and
+# small counts (packet totals, body lengths under 4096) hit the log table;
+# larger values fall back to math.log1p
+_PORT_LUT = np.arange(65536, dtype=np.float32) / 65535.0
+_LOG_LUT = np.log1p(np.arange(4096, dtype=np.float32)) / 20.0
+
+_CONN_STATE_MAP = {
+    "S0": 0.1, "S1": 0.2, "SF": 0.3, "REJ": 0.4, "S2": 0.5,
+    "S3": 0.6, "RSTO": 0.7, "RSTR": 0.8, "RSTOS0": 0.85,
+    "RSTRH": 0.9, "SH": 0.92, "SHR": 0.95, "OTH": 1.0
+}
+
+_HTTP_METHOD_MAP = {
+    "GET": 0.1, "POST": 0.2, "HEAD": 0.3, "PUT": 0.4,
+    "DELETE": 0.5, "OPTIONS": 0.6, "PATCH": 0.7, "CONNECT": 0.9
+}
+
+
+@lru_cache(maxsize=32)
+def _protocol_to_float(protocol: Any) -> float:
+    return _PROTO_MAP.get(str(protocol).lower(), 0.0)
+
+
+@lru_cache(maxsize=64)
+def _conn_state_to_float(state: Any) -> float:
+    return _CONN_STATE_MAP.get(str(state), 0.0)
+
+
+@lru_cache(maxsize=32)
+def _http_method_to_float(method: Any) -> float:
+    return _HTTP_METHOD_MAP.get(str(method).upper(), 0.0)
+
 
 # =============================================================================
 # DAMPED INCREMENTAL STATISTICS
 # =============================================================================
 
-@dataclass
+# Slot layout for the SoA statistics arrays: columns are
+# (weight, mean, var, std, min, max) - one row per tracked metric.
+_STAT_W, _STAT_MEAN, _STAT_VAR, _STAT_STD, _STAT_MIN, _STAT_MAX = range(6)
+
+# Row layout for StreamStatistics state
+_ROW_PKT_SIZE, _ROW_IAT, _ROW_BYTE_RATE, _ROW_PKT_COUNT = range(4)
+
+
+def update_damped(arr: np.ndarray, value: float, decay: float) -> None:
+    """
+    In-place exponential-decay update of one statistics row.
+
+    Module-level scalar function on raw array slots: the per-packet hot loop
+    pays no dataclass attribute dispatch, and the whole body is trivially
+    JIT-compilable should a compiler land in the image.
+    """
+    w = arr[_STAT_W]
+    if w == 0.0:
+        arr[_STAT_W] = 1.0
+        arr[_STAT_MEAN] = value
+        arr[_STAT_VAR] = 0.0
+        arr[_STAT_MIN] = value
+        arr[_STAT_MAX] = value
+        return
+
+    # Exponential decay
+    w = 1.0 + w * (1.0 - decay)
+
+    # Update mean with decay
+    old_mean = arr[_STAT_MEAN]
+    mean = old_mean + (value - old_mean) / w
+
+    # Update variance
+    var = (1.0 - decay) * (arr[_STAT_VAR] + (value - old_mean) * (value - mean))
+
+    arr[_STAT_W] = w
+    arr[_STAT_MEAN] = mean
+    arr[_STAT_VAR] = var
+    arr[_STAT_STD] = math.sqrt(var) if var > 0.0 else 0.0
+
+    # Update min/max
+    if value < arr[_STAT_MIN]:
+        arr[_STAT_MIN] = value
+    if value > arr[_STAT_MAX]:
+        arr[_STAT_MAX] = value
+
+
+def update_stream(state: np.ndarray, timestamp: float, last_timestamp: float,
+                  bytes_transferred: float, pkt_count: float, decay: float) -> None:
+    """Update all four metric rows of a (4, 6) stream-state array in place."""
+    update_damped(state[_ROW_PKT_SIZE], bytes_transferred, decay)
+    update_damped(state[_ROW_PKT_COUNT], pkt_count, decay)
+
+    if last_timestamp > 0.0:
+        iat = timestamp - last_timestamp
+        if iat > 0.0:
+            update_damped(state[_ROW_IAT], iat, decay)
+            update_damped(state[_ROW_BYTE_RATE], bytes_transferred / iat, decay)
+
+
 class DampedStatistics:
     """
     Damped incremental statistics for time-windowed feature extraction.
     Uses exponential decay to give more weight to recent observations.
-    
+
     Based on: "Online learning with Netflow/IPFIX"
-    Captures: count, mean, variance, std, min, max
+    Captures: count, mean, variance, std, min, max - backed by a flat
+    6-slot ndarray updated via the module-level update_damped() kernel.
     """
-    decay_factor: float = 0.1  # Lambda - decay rate
-    
-    weight: float = 0.0
-    mean: float = 0.0
-    var: float = 0.0
-    std: float = 0.0
-    min_val: float = float('inf')
-    max_val: float = float('-inf')
-    
+
+    __slots__ = ("decay_factor", "_state")
+
+    def __init__(self, decay_factor: float = 0.1):
+        self.decay_factor = decay_factor  # Lambda - decay rate
+        self._state = np.zeros(6, dtype=np.float32)
+
     def update(self, value: float):
         """Update statistics with new observation."""
-        if self.weight == 0:
-            self.mean = value
-            self.var = 0.0
-            self.min_val = value
-            self.max_val = value
-            self.weight = 1.0
-        else:
-            # Exponential decay
-            self.weight = 1.0 + self.weight * (1.0 - self.decay_factor)
-            
-            # Update mean with decay
-            old_mean = self.mean
-            self.mean = old_mean + (value - old_mean) / self.weight
-            
-            # Update variance
-            self.var = (1.0 - self.decay_factor) * (self.var + (value - old_mean) * (value - self.mean))
-            self.std = math.sqrt(max(0, self.var))
-            
-            # Update min/max
-            self.min_val = min(self.min_val, value)
-            self.max_val = max(self.max_val, value)
-    
+        update_damped(self._state, value, self.decay_factor)
+
     def get_features(self) -> list[float]:
         """Return all statistics as feature vector."""
-        return [
-            self.weight,
-            self.mean,
-            self.var,
-            self.std,
-            self.min_val if self.min_val != float('inf') else 0,
-            self.max_val if self.max_val != float('-inf') else 0,
-        ]
+        return self._state.tolist()
 
 
-@dataclass  
 class StreamStatistics:
     """
     Statistics for a traffic stream (IP pair or host).
-    Tracks multiple metrics over time with decay.
+    Tracks packet size, inter-arrival time, byte rate and packet count with
+    decay, stored structure-of-arrays as one (4, 6) float array per stream.
     """
-    # Packet size stats
-    pkt_size: DampedStatistics = field(default_factory=lambda: DampedStatistics(0.1))
-    # Inter-arrival time stats
-    iat: DampedStatistics = field(default_factory=lambda: DampedStatistics(0.1))
-    # Byte rate
-    byte_rate: DampedStatistics = field(default_factory=lambda: DampedStatistics(0.1))
-    # Packet count
-    pkt_count: DampedStatistics = field(default_factory=lambda: DampedStatistics(0.1))
-    
-    last_timestamp: float = 0.0
-    
+
+    __slots__ = ("decay_factor", "_state", "last_timestamp")
+
+    def __init__(self, decay_factor: float = 0.1):
+        self.decay_factor = decay_factor
+        self._state = np.zeros((4, 6), dtype=np.float32)
+        self.last_timestamp = 0.0
+
     def update(self, timestamp: float, bytes_transferred: int, pkt_count: int = 1):
         """Update stream statistics."""
-        self.pkt_size.update(bytes_transferred)
-        self.pkt_count.update(pkt_count)
-        
-        if self.last_timestamp > 0:
-            iat = timestamp - self.last_timestamp
-            if iat > 0:
-                self.iat.update(iat)
-                self.byte_rate.update(bytes_transferred / iat)
-        
+        update_stream(self._state, timestamp, self.last_timestamp,
+                      bytes_transferred, pkt_count, self.decay_factor)
         self.last_timestamp = timestamp
-    
-    def get_features(self) -> list[float]:
-        """Get all stream features."""
-        features = []
-        features.extend(self.pkt_size.get_features())
-        features.extend(self.iat.get_features())
-        features.extend(self.byte_rate.get_features())
-        features.extend(self.pkt_count.get_features())
-        return features
+
+    def get_features(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get all stream features (pkt_size, iat, byte_rate, pkt_count rows).
+
+        Returns a zero-copy view of the state array; pass a preallocated
+        24-slot `out` to write into a batch buffer slice instead. No boxed
+        Python floats either way - downstream np.asarray is free.
+        """
+        flat = self._state.ravel()
+        if out is not None:
+            out[:] = flat
+            return out
+        return flat
 
 
 # =============================================================================
@@ -140,83 +207,168 @@ class Autoencoder:
         self.input_size = input_size
         self.hidden_size = max(1, int(input_size * hidden_ratio))
         
-        # Xavier initialization
+        # Xavier initialization (float32: half the memory traffic and twice the
+        # SIMD lane count of float64 in BLAS sgemm - plenty of precision here)
         limit = np.sqrt(6.0 / (self.input_size + self.hidden_size))
-        self.W_enc = np.random.uniform(-limit, limit, (self.input_size, self.hidden_size))
-        self.W_dec = np.random.uniform(-limit, limit, (self.hidden_size, self.input_size))
-        self.b_enc = np.zeros(self.hidden_size)
-        self.b_dec = np.zeros(self.input_size)
-        
-        self.learning_rate = 0.001
-        self.momentum = 0.9
-        
+        self.W_enc = np.random.uniform(-limit, limit, (self.input_size, self.hidden_size)).astype(np.float32)
+        self.W_dec = np.random.uniform(-limit, limit, (self.hidden_size, self.input_size)).astype(np.float32)
+        self.b_enc = np.zeros(self.hidden_size, dtype=np.float32)
+        self.b_dec = np.zeros(self.input_size, dtype=np.float32)
+
+        self.learning_rate = np.float32(0.001)
+        self.momentum = np.float32(0.9)
+
         # Momentum terms
         self.v_W_enc = np.zeros_like(self.W_enc)
         self.v_W_dec = np.zeros_like(self.W_dec)
         self.v_b_enc = np.zeros_like(self.b_enc)
         self.v_b_dec = np.zeros_like(self.b_dec)
-        
-        # Training statistics
+
+        # Training statistics - reconstruction errors live in a fixed float32
+        # ring buffer (4 KB) instead of a deque of boxed Python floats
         self.train_count = 0
-        self.error_history = deque(maxlen=1000)
-    
+        self._err_buf = np.empty(1000, dtype=np.float32)
+        self._err_idx = 0
+        self._err_count = 0
+
+        # Shapes are fixed for the life of the autoencoder, so the
+        # single-sample detect path reuses these scratch buffers instead of
+        # allocating four fresh arrays per predict() call
+        self._hidden_buf = np.empty((1, self.hidden_size), dtype=np.float32)
+        self._out_buf = np.empty((1, self.input_size), dtype=np.float32)
+
+    @staticmethod
+    def _sigmoid_inplace(x: np.ndarray) -> np.ndarray:
+        """In-place 0.5 * (1 + tanh(x/2)) - no temporaries."""
+        x *= 0.5
+        np.tanh(x, out=x)
+        x += 1.0
+        x *= 0.5
+        return x
+
     def _sigmoid(self, x: np.ndarray) -> np.ndarray:
-        """Numerically stable sigmoid."""
-        return np.where(x >= 0, 
-                       1 / (1 + np.exp(-x)), 
-                       np.exp(x) / (1 + np.exp(x)))
-    
+        """Numerically stable branch-free sigmoid: 0.5 * (1 + tanh(x/2))."""
+        # Single-pass and stable for all x, unlike the np.where piecewise form
+        # which evaluates exp() on the full array for both branches.
+        return 0.5 * (1.0 + np.tanh(0.5 * x))
+
     def _sigmoid_deriv(self, x: np.ndarray) -> np.ndarray:
         """Sigmoid derivative."""
         return x * (1 - x)
-    
+
     def forward(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
         """Forward pass."""
         hidden = self._sigmoid(np.dot(x, self.W_enc) + self.b_enc)
         output = self._sigmoid(np.dot(hidden, self.W_dec) + self.b_dec)
         return hidden, output
-    
-    def train_step(self, x: np.ndarray) -> float:
-        """Single training step with backpropagation."""
-        x = x.reshape(1, -1) if x.ndim == 1 else x
-        
+
+    def train_batch(self, X: np.ndarray) -> np.ndarray:
+        """Train on a (B, input_size) batch; returns per-sample RMSE array."""
+        X = np.asarray(X, dtype=np.float32)
+        X = X.reshape(1, -1) if X.ndim == 1 else X
+
         # Forward pass
-        hidden, output = self.forward(x)
-        
-        # Reconstruction error (RMSE)
-        error = np.sqrt(np.mean((x - output) ** 2))
-        self.error_history.append(error)
-        self.train_count += 1
-        
+        hidden, output = self.forward(X)
+
+        # Per-sample reconstruction error (RMSE)
+        diff = output - X
+        errors = np.sqrt(np.mean(diff ** 2, axis=1))
+        self._record_errors(errors)
+        self.train_count += X.shape[0]
+
         # Backpropagation
-        output_delta = (output - x) * self._sigmoid_deriv(output)
+        output_delta = diff * self._sigmoid_deriv(output)
         hidden_delta = np.dot(output_delta, self.W_dec.T) * self._sigmoid_deriv(hidden)
-        
+
         # Gradient with momentum
         self.v_W_dec = self.momentum * self.v_W_dec - self.learning_rate * np.dot(hidden.T, output_delta)
         self.v_b_dec = self.momentum * self.v_b_dec - self.learning_rate * np.sum(output_delta, axis=0)
-        self.v_W_enc = self.momentum * self.v_W_enc - self.learning_rate * np.dot(x.T, hidden_delta)
+        self.v_W_enc = self.momentum * self.v_W_enc - self.learning_rate * np.dot(X.T, hidden_delta)
         self.v_b_enc = self.momentum * self.v_b_enc - self.learning_rate * np.sum(hidden_delta, axis=0)
-        
+
         # Update weights
         self.W_dec += self.v_W_dec
         self.b_dec += self.v_b_dec
         self.W_enc += self.v_W_enc
         self.b_enc += self.v_b_enc
-        
-        return error
-    
+
+        return errors
+
+    def train_step(self, x: np.ndarray) -> float:
+        """Single training step - thin wrapper over train_batch."""
+        return float(self.train_batch(x)[0])
+
+    def predict_batch(self, X: np.ndarray) -> np.ndarray:
+        """Reconstruction error for a (B, input_size) batch as anomaly scores."""
+        X = np.asarray(X, dtype=np.float32)
+        X = X.reshape(1, -1) if X.ndim == 1 else X
+        _, output = self.forward(X)
+        return np.sqrt(np.mean((X - output) ** 2, axis=1))
+
     def predict(self, x: np.ndarray) -> float:
-        """Get reconstruction error as anomaly score."""
-        x = x.reshape(1, -1) if x.ndim == 1 else x
-        _, output = self.forward(x)
-        return np.sqrt(np.mean((x - output) ** 2))
+        """
+        Get reconstruction error as anomaly score.
+
+        Shape-specialized single-sample path: runs the forward pass through
+        the preallocated scratch buffers with out= matmuls, so the per-packet
+        ensemble sweep does no array allocation at all.
+        """
+        x = np.asarray(x, dtype=np.float32).reshape(1, -1)
+
+        np.dot(x, self.W_enc, out=self._hidden_buf)
+        self._hidden_buf += self.b_enc
+        self._sigmoid_inplace(self._hidden_buf)
+
+        np.dot(self._hidden_buf, self.W_dec, out=self._out_buf)
+        self._out_buf += self.b_dec
+        self._sigmoid_inplace(self._out_buf)
+
+        self._out_buf -= x
+        diff = self._out_buf.ravel()
+        return math.sqrt(float(np.dot(diff, diff)) / self.input_size)
     
+    def _record_errors(self, errors: np.ndarray):
+        """Write a batch of errors into the ring buffer."""
+        n = errors.shape[0]
+        idx = (self._err_idx + np.arange(n)) % self._err_buf.shape[0]
+        self._err_buf[idx] = errors
+        self._err_idx = int(idx[-1]) + 1 if n else self._err_idx
+        self._err_idx %= self._err_buf.shape[0]
+        self._err_count = min(self._err_count + n, self._err_buf.shape[0])
+
+    @property
+    def error_count(self) -> int:
+        """Number of reconstruction errors currently held in the ring buffer."""
+        return self._err_count
+
+    def load_weights(self, W_enc: np.ndarray, W_dec: np.ndarray,
+                     b_enc: np.ndarray, b_dec: np.ndarray):
+        """
+        Restore persisted weights, resetting momentum and scratch buffers.
+        Archives store float16; the casts below upcast back to float32 once
+        here so the hot path never touches half precision.
+        """
+        self.input_size = W_enc.shape[0]
+        self.hidden_size = W_enc.shape[1]
+        self.W_enc = np.ascontiguousarray(W_enc, dtype=np.float32)
+        self.W_dec = np.ascontiguousarray(W_dec, dtype=np.float32)
+        self.b_enc = np.ascontiguousarray(b_enc, dtype=np.float32)
+        self.b_dec = np.ascontiguousarray(b_dec, dtype=np.float32)
+        self.v_W_enc = np.zeros_like(self.W_enc)
+        self.v_W_dec = np.zeros_like(self.W_dec)
+        self.v_b_enc = np.zeros_like(self.b_enc)
+        self.v_b_dec = np.zeros_like(self.b_dec)
+        self._hidden_buf = np.empty((1, self.hidden_size), dtype=np.float32)
+        self._out_buf = np.empty((1, self.input_size), dtype=np.float32)
+
     def get_threshold(self, percentile: float = 99.0) -> float:
         """Get anomaly threshold based on training error distribution."""
-        if len(self.error_history) < 100:
+        n = self._err_count
+        if n < 100:
             return 1.0
-        return np.percentile(list(self.error_history), percentile)
+        # np.partition is O(n) quickselect - no list copy, no full sort
+        k = min(int(n * (percentile / 100.0)), n - 1)
+        return float(np.partition(self._err_buf[:n], k)[k])
 
 
 # =============================================================================
@@ -232,47 +384,62 @@ class FeatureMapper:
     def __init__(self, max_clusters: int = 10, min_cluster_size: int = 3):
         self.max_clusters = max_clusters
         self.min_cluster_size = min_cluster_size
-        self.feature_buffer: list[np.ndarray] = []
-        self.buffer_size = 2000  # Samples to collect before clustering
+        self.buffer_size = 2000  # Samples to accumulate before clustering
+        # Streaming second moments instead of a sample buffer: the
+        # correlation matrix only needs sum(x) and sum(x xT), so each sample
+        # folds into an (F,) vector and an (F,F) outer-product accumulator
+        # and is then forgotten. float64 keeps the x*x sums from losing
+        # precision over thousands of samples.
+        self._sx: Optional[np.ndarray] = None
+        self._sxx: Optional[np.ndarray] = None
+        self._n = 0
         self.feature_groups: list[list[int]] = []
         self.is_ready = False
-    
+
     def add_sample(self, features: np.ndarray) -> bool:
-        """Add sample to buffer. Returns True when ready to map."""
-        self.feature_buffer.append(features.flatten())
-        
-        if len(self.feature_buffer) >= self.buffer_size:
+        """Fold sample into the moment accumulators. Returns True when ready to map."""
+        x = features.ravel().astype(np.float64)
+        if self._sx is None:
+            self._sx = np.zeros(x.size, dtype=np.float64)
+            self._sxx = np.zeros((x.size, x.size), dtype=np.float64)
+        self._sx += x
+        self._sxx += np.outer(x, x)
+        self._n += 1
+
+        if self._n >= self.buffer_size:
             self._compute_feature_groups()
             return True
         return False
-    
+
     def _compute_feature_groups(self):
         """Compute feature groups using correlation-based clustering."""
-        data = np.array(self.feature_buffer)
-        n_features = data.shape[1]
-        
+        n_features = self._sx.size
+
         logger.info(f"🔧 Computing feature groups for {n_features} features...")
-        
-        # Compute correlation matrix
-        # Use transpose so we cluster features, not samples
-        data_T = data.T  # Shape: (n_features, n_samples)
-        
-        # Standardize each feature
-        means = np.mean(data_T, axis=1, keepdims=True)
-        stds = np.std(data_T, axis=1, keepdims=True)
-        stds[stds == 0] = 1  # Avoid division by zero
-        data_normalized = (data_T - means) / stds
-        
+
+        # Correlation follows analytically from the accumulated moments:
+        # cov = E[x xT] - E[x] E[x]T, corr = cov / (std stdT)
+        mean = self._sx / self._n
+        cov = self._sxx / self._n - np.outer(mean, mean)
+        std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+        std[std == 0] = 1  # Avoid division by zero
+        corr = cov / np.outer(std, std)
+
         # Determine number of clusters
         n_clusters = min(self.max_clusters, max(2, n_features // self.min_cluster_size))
-        
-        # Cluster features
-        kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=42, n_init=3)
-        labels = kmeans.fit_predict(data_normalized)
-        
-        # Group features by cluster
+
+        # Cluster on the feature-feature correlation matrix directly - the
+        # original KitNET mapping. Distance 1-|corr| puts strongly correlated
+        # features (positive or negative) in the same subtree; average-linkage
+        # agglomeration is deterministic, unlike k-means on raw sample rows.
+        # Clip guards against float rounding pushing |corr| past 1
+        dist = squareform(np.clip(1.0 - np.abs(corr), 0.0, None), checks=False)
+        Z = linkage(dist, method='average')
+        labels = fcluster(Z, t=n_clusters, criterion='maxclust')
+
+        # Group features by cluster (fcluster labels start at 1)
         self.feature_groups = []
-        for cluster_id in range(n_clusters):
+        for cluster_id in range(1, labels.max() + 1):
             group = [i for i, label in enumerate(labels) if label == cluster_id]
             if len(group) >= 2:  # Minimum group size
                 self.feature_groups.append(group)
@@ -292,8 +459,10 @@ class FeatureMapper:
                 self.feature_groups.append(uncovered)
         
         self.is_ready = True
-        self.feature_buffer = []  # Clear buffer
-        
+        self._sx = None  # Release accumulators
+        self._sxx = None
+        self._n = 0
+
         logger.info(f"✅ Created {len(self.feature_groups)} feature groups: {[len(g) for g in self.feature_groups]}")
     
     def get_groups(self) -> list[list[int]]:
@@ -321,6 +490,17 @@ class KitNETDetector:
     FM_SAMPLES = 2000      # Samples for feature mapping phase
     AD_SAMPLES = 10000     # Samples for autoencoder training
     TOTAL_TRAINING = 12000 # Total training samples
+
+    # Fixed slot layout of the 60-feature vector (section start offsets)
+    F_CONN = 0    # connection metadata (10)
+    F_BYTES = 10  # byte/packet statistics (12)
+    F_TIME = 22   # time-based features (6)
+    F_PROTO = 28  # protocol one-hots (8)
+    F_DNS = 36    # DNS features (8)
+    F_HTTP = 44   # HTTP features (6)
+    F_SSL = 50    # SSL/TLS features (6)
+    F_RATIO = 56  # computed ratios (4)
+    N_FEATURES = 60
     
     def __init__(self, model_path: Path, threshold: float = 0.95):
         self.model_path = model_path
@@ -333,18 +513,43 @@ class KitNETDetector:
         self.output_autoencoder: Optional[Autoencoder] = None
         self.scaler = StandardScaler()
         
-        # State
+        # State - self._impl mirrors self.phase and must be reassigned
+        # whenever the phase changes
         self.phase = "FM"  # FM, AD, or DETECT
+        self._impl = self._fm_phase
         self.training_samples = 0
         self.scaler_fitted = False
-        
-        # Stream statistics for hosts (damped incremental)
-        self.host_stats: dict[str, StreamStatistics] = {}
-        self.pair_stats: dict[str, StreamStatistics] = {}
+
+        # Flattened gather index over feature groups (built with the AEs),
+        # plus the scaler mean/reciprocal-scale pre-gathered over that index
+        self._group_index = np.empty(0, dtype=np.int32)
+        self._group_bounds = np.zeros(1, dtype=np.int64)
+        self._scaler_mean_g = np.empty(0, dtype=np.float32)
+        self._scaler_inv_scale_g = np.empty(0, dtype=np.float32)
+
+        # Reused layer-1 score vector, one slot per autoencoder
+        self._l1_scores = np.empty(0, dtype=np.float32)
+
+        # Reused per-packet feature buffer - extract_features writes slots in
+        # place instead of growing a Python list per packet
+        self._feat = np.empty((1, self.N_FEATURES), dtype=np.float32)
+
+        # One-entry weekday cache keyed by the date prefix of the last
+        # timestamp seen - avoids a full datetime parse per packet
+        self._weekday_cache: dict[str, int] = {}
+        
+        # Stream statistics for hosts (damped incremental). OrderedDict in
+        # LRU order - _touch_stats moves hit entries to the back and evicts
+        # from the front, so the tables stay bounded without periodic sweeps
+        self.host_stats: OrderedDict[str, StreamStatistics] = OrderedDict()
+        self.pair_stats: OrderedDict[str, StreamStatistics] = OrderedDict()
         self.max_stats_entries = 10000
         
-        # Anomaly tracking
-        self.anomaly_scores_history = deque(maxlen=5000)
+        # Anomaly tracking - last 5000 scores, fixed float32 ring buffer
+        # (20 KB flat, and appends never touch the allocator)
+        self._score_ring = np.zeros(5000, dtype=np.float32)
+        self._score_ring_idx = 0
+        self._score_ring_full = False
         self.detection_stats = {
             "total_processed": 0,
             "anomalies_detected": 0,
@@ -360,9 +565,11 @@ class KitNETDetector:
             logger.info("📁 Loading existing KitNET model...")
             self.load_model()
             self.phase = "DETECT"
+            self._impl = self._detect_phase
         else:
             logger.info("🧠 No model found - Starting training phase...")
             self.phase = "FM"
+            self._impl = self._fm_phase
     
     def extract_features(self, packet_data: dict[str, Any]) -> np.ndarray:
         """
@@ -378,34 +585,44 @@ class KitNETDetector:
         - SSL/TLS features (6 features)
         - Damped stream statistics (variable)
         """
-        features = []
-        
+        # Slots are written in place into the reused buffer - no Python list
+        # growth or boxed-float materialization per packet. The buffer is
+        # copied by every downstream consumer (scaler, FM buffer), so reuse
+        # across packets is safe.
+        f = self._feat[0]
+
+        # Bind the dict lookup once - this method calls it ~20 times per
+        # packet, and the attribute walk adds up at line rate
+        get = packet_data.get
+        _i = lambda k: int(get(k, 0) or 0)
+
         # === 1. CONNECTION METADATA (10 features) ===
-        src_port = int(packet_data.get("src_port", 0) or 0)
-        dest_port = int(packet_data.get("dest_port", 0) or 0)
-        
-        features.extend([
+        src_port = _i("src_port")
+        dest_port = _i("dest_port")
+        duration = float(get("duration", 0.0) or 0.0)
+
+        f[self.F_CONN:self.F_BYTES] = (
             self._normalize_port(src_port),
             self._normalize_port(dest_port),
             1.0 if src_port < 1024 else 0.0,  # Is well-known source port
             1.0 if dest_port < 1024 else 0.0,  # Is well-known dest port
-            self._protocol_to_float(packet_data.get("protocol", "tcp")),
-            self._conn_state_to_float(packet_data.get("conn_state", "")),
-            float(packet_data.get("duration", 0.0) or 0.0),
-            min(float(packet_data.get("duration", 0.0) or 0.0) / 3600.0, 1.0),  # Duration normalized
-            1.0 if packet_data.get("local_orig", False) else 0.0,
-            1.0 if packet_data.get("local_resp", False) else 0.0,
-        ])
-        
+            self._protocol_to_float(get("protocol", "tcp")),
+            self._conn_state_to_float(get("conn_state", "")),
+            duration,
+            min(duration / 3600.0, 1.0),  # Duration normalized
+            1.0 if get("local_orig", False) else 0.0,
+            1.0 if get("local_resp", False) else 0.0,
+        )
+
         # === 2. BYTE/PACKET STATISTICS (12 features) ===
-        orig_bytes = int(packet_data.get("orig_bytes", 0) or 0)
-        resp_bytes = int(packet_data.get("resp_bytes", 0) or 0)
-        orig_pkts = int(packet_data.get("orig_pkts", 0) or 0)
-        resp_pkts = int(packet_data.get("resp_pkts", 0) or 0)
+        orig_bytes = _i("orig_bytes")
+        resp_bytes = _i("resp_bytes")
+        orig_pkts = _i("orig_pkts")
+        resp_pkts = _i("resp_pkts")
         total_bytes = orig_bytes + resp_bytes
         total_pkts = orig_pkts + resp_pkts
-        
-        features.extend([
+
+        f[self.F_BYTES:self.F_TIME] = (
             self._log_normalize(orig_bytes),
             self._log_normalize(resp_bytes),
             self._log_normalize(total_bytes),
@@ -416,18 +633,17 @@ class KitNETDetector:
             self._log_normalize(total_pkts),
             orig_bytes / (orig_pkts + 1),  # Avg orig pkt size
             resp_bytes / (resp_pkts + 1),  # Avg resp pkt size
-            int(packet_data.get("missed_bytes", 0) or 0) / (total_bytes + 1),  # Miss ratio
-            len(packet_data.get("history", "")),  # History length
-        ])
-        
+            _i("missed_bytes") / (total_bytes + 1),  # Miss ratio
+            len(get("history", "")),  # History length
+        )
+
         # === 3. TIME-BASED FEATURES (6 features) ===
-        timestamp = packet_data.get("timestamp", "")
-        time_features = self._extract_time_features(timestamp)
-        features.extend(time_features)
-        
+        timestamp = get("timestamp", "")
+        f[self.F_TIME:self.F_PROTO] = self._extract_time_features(timestamp)
+
         # === 4. PROTOCOL-SPECIFIC (8 features) ===
-        service = str(packet_data.get("service", "") or "")
-        features.extend([
+        service = str(get("service", "") or "")
+        f[self.F_PROTO:self.F_DNS] = (
             1.0 if service == "dns" else 0.0,
             1.0 if service == "http" else 0.0,
             1.0 if service == "ssl" else 0.0,
@@ -436,83 +652,87 @@ class KitNETDetector:
             1.0 if service == "ftp" else 0.0,
             1.0 if service in ("smb", "dce_rpc") else 0.0,
             1.0 if service == "" else 0.0,  # Unknown service
-        ])
-        
-        # === 5. DNS FEATURES (8 features) ===
-        dns_queries = packet_data.get("dns_queries", [])
-        has_dns = packet_data.get("has_dns", False) or len(dns_queries) > 0
-        
-        if has_dns and dns_queries:
-            dns_data = dns_queries[0] if isinstance(dns_queries, list) else dns_queries
-            query = str(dns_data.get("query", "") or "")
-            features.extend([
-                1.0,  # Has DNS
-                len(query) / 255.0,  # Query length normalized
-                query.count(".") / 10.0,  # Subdomain depth
-                self._calculate_entropy(query) / 4.0,  # Query entropy
-                1.0 if dns_data.get("rejected", False) else 0.0,
-                len(dns_data.get("answers", [])) / 10.0,  # Answer count
-                1.0 if len(query) > 50 else 0.0,  # Long query (tunneling indicator)
-                self._calculate_entropy(query.split(".")[0]) / 4.0 if "." in query else 0.0,  # First label entropy
-            ])
-        else:
-            features.extend([0.0] * 8)
-        
-        # === 6. HTTP FEATURES (6 features) ===
-        http_requests = packet_data.get("http_requests", [])
-        has_http = packet_data.get("has_http", False) or len(http_requests) > 0
-        
-        if has_http and http_requests:
-            http_data = http_requests[0] if isinstance(http_requests, list) else http_requests
-            features.extend([
-                1.0,  # Has HTTP
-                self._http_method_to_float(http_data.get("method", "")),
-                self._log_normalize(int(http_data.get("request_body_len", 0) or 0)),
-                self._log_normalize(int(http_data.get("response_body_len", 0) or 0)),
-                len(str(http_data.get("uri", ""))) / 2000.0,  # URI length
-                1.0 if http_data.get("uri_suspicious", False) else 0.0,
-            ])
-        else:
-            features.extend([0.0] * 6)
-        
-        # === 7. SSL/TLS FEATURES (6 features) ===
-        ssl_info = packet_data.get("ssl_info", {})
-        has_ssl = packet_data.get("has_ssl", False) or bool(ssl_info)
-        
-        if has_ssl and ssl_info:
-            features.extend([
-                1.0,  # Has SSL
-                1.0 if ssl_info.get("established", False) else 0.0,
-                1.0 if ssl_info.get("self_signed", False) else 0.0,
-                1.0 if ssl_info.get("expired", False) else 0.0,
-                1.0 if ssl_info.get("cert_valid", True) else 0.0,
-                len(str(ssl_info.get("server_name", ""))) / 255.0,  # SNI length
-            ])
+        )
+
+        # === 5-7. DNS/HTTP/SSL PRECHECK ===
+        # The overwhelming share of conn records carry none of the three
+        # higher-layer sections; one 20-wide zero fill replaces the three
+        # per-section branches for that common case.
+        dns_queries = get("dns_queries", [])
+        has_dns = get("has_dns", False) or len(dns_queries) > 0
+        http_requests = get("http_requests", [])
+        has_http = get("has_http", False) or len(http_requests) > 0
+        ssl_info = get("ssl_info", {})
+        has_ssl = get("has_ssl", False) or bool(ssl_info)
+
+        if not (has_dns or has_http or has_ssl):
+            f[self.F_DNS:self.F_RATIO] = _ZEROS_20
         else:
-            features.extend([0.0] * 6)
-        
+            # === 5. DNS FEATURES (8 features) ===
+            if has_dns and dns_queries:
+                dns_data = dns_queries[0] if isinstance(dns_queries, list) else dns_queries
+                query = str(dns_data.get("query", "") or "")
+                f[self.F_DNS:self.F_HTTP] = (
+                    1.0,  # Has DNS
+                    len(query) / 255.0,  # Query length normalized
+                    query.count(".") / 10.0,  # Subdomain depth
+                    self._calculate_entropy(query) / 4.0,  # Query entropy
+                    1.0 if dns_data.get("rejected", False) else 0.0,
+                    len(dns_data.get("answers", [])) / 10.0,  # Answer count
+                    1.0 if len(query) > 50 else 0.0,  # Long query (tunneling indicator)
+                    self._calculate_entropy(query.split(".")[0]) / 4.0 if "." in query else 0.0,  # First label entropy
+                )
+            else:
+                f[self.F_DNS:self.F_HTTP] = 0.0
+
+            # === 6. HTTP FEATURES (6 features) ===
+            if has_http and http_requests:
+                http_data = http_requests[0] if isinstance(http_requests, list) else http_requests
+                f[self.F_HTTP:self.F_SSL] = (
+                    1.0,  # Has HTTP
+                    self._http_method_to_float(http_data.get("method", "")),
+                    self._log_normalize(int(http_data.get("request_body_len", 0) or 0)),
+                    self._log_normalize(int(http_data.get("response_body_len", 0) or 0)),
+                    len(str(http_data.get("uri", ""))) / 2000.0,  # URI length
+                    1.0 if http_data.get("uri_suspicious", False) else 0.0,
+                )
+            else:
+                f[self.F_HTTP:self.F_SSL] = 0.0
+
+            # === 7. SSL/TLS FEATURES (6 features) ===
+            if has_ssl and ssl_info:
+                f[self.F_SSL:self.F_RATIO] = (
+                    1.0,  # Has SSL
+                    1.0 if ssl_info.get("established", False) else 0.0,
+                    1.0 if ssl_info.get("self_signed", False) else 0.0,
+                    1.0 if ssl_info.get("expired", False) else 0.0,
+                    1.0 if ssl_info.get("cert_valid", True) else 0.0,
+                    len(str(ssl_info.get("server_name", ""))) / 255.0,  # SNI length
+                )
+            else:
+                f[self.F_SSL:self.F_RATIO] = 0.0
+
         # === 8. COMPUTED RATIOS (4 features) ===
-        features.extend([
-            packet_data.get("bytes_ratio", 0.0) if packet_data.get("bytes_ratio", 0.0) != float('inf') else 10.0,
-            packet_data.get("pkt_ratio", 0.0) if packet_data.get("pkt_ratio", 0.0) != float('inf') else 10.0,
-            packet_data.get("query_entropy", 0.0),
-            packet_data.get("sld_entropy", 0.0),
-        ])
-        
+        bytes_ratio = get("bytes_ratio", 0.0)
+        pkt_ratio = get("pkt_ratio", 0.0)
+        f[self.F_RATIO:self.N_FEATURES] = (
+            bytes_ratio if bytes_ratio != float('inf') else 10.0,
+            pkt_ratio if pkt_ratio != float('inf') else 10.0,
+            get("query_entropy", 0.0),
+            get("sld_entropy", 0.0),
+        )
+
         # Total: 10 + 12 + 6 + 8 + 8 + 6 + 6 + 4 = 60 features
-        
-        return np.array(features, dtype=np.float32).reshape(1, -1)
+
+        return self._feat
     
     def detect_anomaly(self, features: np.ndarray) -> float:
         """Detect anomaly and return score (0.0 - 1.0)."""
         self.detection_stats["total_processed"] += 1
-        
-        if self.phase == "FM":
-            return self._fm_phase(features)
-        elif self.phase == "AD":
-            return self._ad_phase(features)
-        else:
-            return self._detect_phase(features)
+
+        # Phase dispatch is a bound-method pointer swapped at transitions,
+        # not a string comparison chain run once per packet
+        return self._impl(features)
     
     def _fm_phase(self, features: np.ndarray) -> float:
         """Feature Mapping phase - learn feature correlations."""
@@ -532,6 +752,7 @@ class KitNETDetector:
             logger.info(f"✅ FM phase complete after {self.training_samples} samples")
             self._initialize_autoencoders()
             self.phase = "AD"
+            self._impl = self._ad_phase
             self.scaler_fitted = True
         
         return 0.0  # No anomaly detection during FM
@@ -542,20 +763,23 @@ class KitNETDetector:
         self.detection_stats["phase"] = "AD"
         self.detection_stats["training_progress"] = self.training_samples / self.TOTAL_TRAINING
         
-        features_normalized = self.scaler.transform(features)
-        
-        # Train each autoencoder
-        layer1_outputs = []
+        # One gather covers every group, with the scaler fused in; each AE
+        # reads its contiguous slice
+        raw = features.ravel()[self._group_index]
+        gathered = (raw - self._scaler_mean_g) * self._scaler_inv_scale_g
+        bounds = self._group_bounds
+
+        # Train each autoencoder, writing its output into the reused
+        # layer-1 score vector
+        scores = self._l1_scores
         for i, ae in enumerate(self.autoencoders):
-            group = self.feature_mapper.get_groups()[i]
-            feature_subset = features_normalized[:, group].flatten()
+            feature_subset = gathered[bounds[i]:bounds[i + 1]]
             ae.train_step(feature_subset)
-            layer1_outputs.append(ae.predict(feature_subset))
-        
+            scores[i] = ae.predict(feature_subset)
+
         # Train output autoencoder
-        if self.output_autoencoder and layer1_outputs:
-            output_features = np.array(layer1_outputs).reshape(1, -1)
-            self.output_autoencoder.train_step(output_features.flatten())
+        if self.output_autoencoder and scores.size:
+            self.output_autoencoder.train_step(scores)
         
         # Check if training complete
         if self.training_samples >= self.TOTAL_TRAINING:
@@ -567,28 +791,31 @@ class KitNETDetector:
         """Online anomaly detection phase."""
         self.detection_stats["phase"] = "DETECT"
         
-        features_normalized = self.scaler.transform(features)
-        
-        # Get scores from layer 1 autoencoders
-        layer1_scores = []
+        # Get scores from layer 1 autoencoders (single fused
+        # normalize-and-gather, sliced per AE)
+        raw = features.ravel()[self._group_index]
+        gathered = (raw - self._scaler_mean_g) * self._scaler_inv_scale_g
+        bounds = self._group_bounds
+
+        scores = self._l1_scores
         for i, ae in enumerate(self.autoencoders):
-            group = self.feature_mapper.feature_groups[i]
-            feature_subset = features_normalized[:, group].flatten()
-            score = ae.predict(feature_subset)
-            layer1_scores.append(score)
-        
+            scores[i] = ae.predict(gathered[bounds[i]:bounds[i + 1]])
+
         # Get final score from output autoencoder
-        if self.output_autoencoder and layer1_scores:
-            output_features = np.array(layer1_scores).reshape(1, -1)
-            final_score = self.output_autoencoder.predict(output_features.flatten())
+        if self.output_autoencoder and scores.size:
+            final_score = self.output_autoencoder.predict(scores)
         else:
-            final_score = max(layer1_scores) if layer1_scores else 0.0
+            final_score = float(scores.max()) if scores.size else 0.0
         
         # Normalize score
         normalized_score = min(final_score / self.adaptive_threshold, 1.0)
         
         # Track for statistics
-        self.anomaly_scores_history.append(normalized_score)
+        self._score_ring[self._score_ring_idx] = normalized_score
+        self._score_ring_idx += 1
+        if self._score_ring_idx >= self._score_ring.size:
+            self._score_ring_idx = 0
+            self._score_ring_full = True
         
         if normalized_score >= 1.0:
             self.detection_stats["anomalies_detected"] += 1
@@ -598,128 +825,229 @@ class KitNETDetector:
     def _initialize_autoencoders(self):
         """Initialize autoencoders based on feature groups."""
         groups = self.feature_mapper.get_groups()
-        
+
         logger.info(f"🔧 Initializing {len(groups)} autoencoders...")
-        
+
         self.autoencoders = []
         for group in groups:
             ae = Autoencoder(input_size=len(group), hidden_ratio=0.75)
             self.autoencoders.append(ae)
-        
+
         # Output autoencoder takes layer 1 outputs
         self.output_autoencoder = Autoencoder(input_size=len(groups), hidden_ratio=0.75)
-        
+
+        self._build_group_index()
+
         logger.info(f"✅ Created {len(self.autoencoders)} layer-1 AEs + 1 output AE")
+
+    def _build_group_index(self):
+        """
+        Flatten the feature groups into one gather index plus slice bounds,
+        so the per-packet phases do a single fancy-index instead of one
+        per autoencoder.
+        """
+        groups = self.feature_mapper.get_groups()
+        self._group_index = np.concatenate(
+            [np.asarray(g, dtype=np.int32) for g in groups]
+        ) if groups else np.empty(0, dtype=np.int32)
+        self._group_bounds = np.cumsum([0] + [len(g) for g in groups])
+
+        # Pre-gather the scaler terms so the per-packet phases fuse
+        # normalization with the gather - (raw[idx] - mean) * inv_scale over
+        # just the indexed slots replaces a full-width sklearn transform.
+        # StandardScaler pins scale_ to 1 for constant features, so the
+        # reciprocal is always finite.
+        mean = np.asarray(self.scaler.mean_, dtype=np.float32)
+        inv_scale = 1.0 / np.asarray(self.scaler.scale_, dtype=np.float32)
+        self._scaler_mean_g = mean[self._group_index]
+        self._scaler_inv_scale_g = inv_scale[self._group_index]
+
+        # One layer-1 score slot per group, reused every packet
+        self._l1_scores = np.empty(len(groups), dtype=np.float32)
     
     def _finalize_training(self):
         """Finalize training and compute adaptive threshold."""
         logger.info(f"✅ Training complete after {self.training_samples} samples")
         
         # Compute adaptive threshold from output autoencoder
-        if self.output_autoencoder and len(self.output_autoencoder.error_history) > 100:
+        if self.output_autoencoder and self.output_autoencoder.error_count > 100:
             self.adaptive_threshold = self.output_autoencoder.get_threshold(99.0)
             logger.info(f"📊 Adaptive threshold: {self.adaptive_threshold:.4f}")
         
         self.phase = "DETECT"
+        self._impl = self._detect_phase
         self.save_model()
     
     # === UTILITY METHODS ===
-    
+
+    def _touch_stats(self, table: OrderedDict, key: str) -> StreamStatistics:
+        """
+        Fetch (or create) a stream-statistics entry and mark it most
+        recently used, evicting the stalest entry once the table is full.
+        """
+        stats = table.get(key)
+        if stats is None:
+            stats = StreamStatistics()
+            table[key] = stats
+            if len(table) > self.max_stats_entries:
+                table.popitem(last=False)
+        else:
+            table.move_to_end(key)
+        return stats
+
     def _normalize_port(self, port: int) -> float:
         """Normalize port number."""
+        if 0 <= port < 65536:
+            return _PORT_LUT[port]
         return min(port / 65535.0, 1.0)
-    
+
     def _log_normalize(self, value: float) -> float:
         """Log normalize a value."""
+        if 0 <= value < 4096 and value == int(value):
+            return _LOG_LUT[int(value)]
         return math.log1p(value) / 20.0  # log1p(1M) ≈ 14
     
     def _protocol_to_float(self, protocol: str) -> float:
         """Convert protocol to float."""
-        mapping = {"tcp": 0.2, "udp": 0.4, "icmp": 0.6, "sctp": 0.8}
-        return mapping.get(str(protocol).lower(), 0.0)
-    
+        return _protocol_to_float(protocol)
+
     def _conn_state_to_float(self, state: str) -> float:
         """Convert connection state to float."""
-        mapping = {
-            "S0": 0.1, "S1": 0.2, "SF": 0.3, "REJ": 0.4, "S2": 0.5,
-            "S3": 0.6, "RSTO": 0.7, "RSTR": 0.8, "RSTOS0": 0.85, 
-            "RSTRH": 0.9, "SH": 0.92, "SHR": 0.95, "OTH": 1.0
-        }
-        return mapping.get(str(state), 0.0)
-    
+        return _conn_state_to_float(state)
+
     def _http_method_to_float(self, method: str) -> float:
         """Convert HTTP method to float."""
-        mapping = {
-            "GET": 0.1, "POST": 0.2, "HEAD": 0.3, "PUT": 0.4,
-            "DELETE": 0.5, "OPTIONS": 0.6, "PATCH": 0.7, "CONNECT": 0.9
-        }
-        return mapping.get(str(method).upper(), 0.0)
+        return _http_method_to_float(method)
     
     def _extract_time_features(self, timestamp_str: str) -> list[float]:
         """Extract time-based features."""
         try:
-            ts = str(timestamp_str).replace('Z', '+00:00')
-            dt = datetime.fromisoformat(ts)
+            ts = str(timestamp_str)
+            # Fast path: ISO timestamps have fixed field positions, so the
+            # hour/minute digits can be sliced out without building a datetime.
+            # The weekday only changes once a day, so it is cached per date.
+            try:
+                hour = int(ts[11:13])
+                minute = int(ts[14:16])
+                date_prefix = ts[:10]
+                weekday = self._weekday_cache.get(date_prefix)
+                if weekday is None:
+                    y, m, d = date_prefix.split('-')
+                    weekday = datetime(int(y), int(m), int(d)).weekday()
+                    self._weekday_cache = {date_prefix: weekday}
+            except (ValueError, IndexError):
+                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+                hour, minute, weekday = dt.hour, dt.minute, dt.weekday()
             return [
-                dt.hour / 23.0,
-                dt.minute / 59.0,
-                dt.weekday() / 6.0,
-                1.0 if dt.weekday() >= 5 else 0.0,  # Weekend
-                1.0 if 9 <= dt.hour <= 17 else 0.0,  # Business hours
-                1.0 if 0 <= dt.hour <= 6 else 0.0,   # Night time
+                hour / 23.0,
+                minute / 59.0,
+                weekday / 6.0,
+                1.0 if weekday >= 5 else 0.0,  # Weekend
+                1.0 if 9 <= hour <= 17 else 0.0,  # Business hours
+                1.0 if 0 <= hour <= 6 else 0.0,   # Night time
             ]
         except (ValueError, TypeError, AttributeError):
             return [0.0] * 6
     
     def _calculate_entropy(self, text: str) -> float:
-        """Calculate Shannon entropy."""
+        """Calculate Shannon entropy over the UTF-8 bytes of the text."""
         if not text:
             return 0.0
-        from collections import Counter
-        freq = Counter(text.lower())
-        length = len(text)
-        entropy = -sum((c / length) * math.log2(c / length) for c in freq.values())
-        return entropy
+        # Histogram over byte values instead of Counter + a per-char Python
+        # generator - the whole computation stays vectorized
+        buf = np.frombuffer(text.lower().encode('utf-8', 'ignore'), dtype=np.uint8)
+        counts = np.bincount(buf)
+        counts = counts[counts > 0]
+        p = counts / buf.size
+        return float(-(p * np.log2(p)).sum())
     
     # === PERSISTENCE ===
     
+    MODEL_VERSION = '3.0'
+
     def save_model(self):
-        """Save trained model."""
-        model_data = {
+        """
+        Save trained model as compressed ndarrays plus a JSON metadata blob.
+        No pickled Python objects: loads never execute arbitrary code and
+        skip object-graph reconstruction entirely.
+        """
+        # Weights are stored as float16 - half the bytes on disk, and the
+        # precision loss (~3 decimal digits) is far below the reconstruction
+        # error the thresholds operate on. load_weights upcasts to float32.
+        arrays: dict[str, np.ndarray] = {}
+        for i, ae in enumerate(self.autoencoders):
+            arrays[f'ae{i}_W_enc'] = ae.W_enc.astype(np.float16)
+            arrays[f'ae{i}_W_dec'] = ae.W_dec.astype(np.float16)
+            arrays[f'ae{i}_b_enc'] = ae.b_enc.astype(np.float16)
+            arrays[f'ae{i}_b_dec'] = ae.b_dec.astype(np.float16)
+        if self.output_autoencoder:
+            arrays['out_W_enc'] = self.output_autoencoder.W_enc.astype(np.float16)
+            arrays['out_W_dec'] = self.output_autoencoder.W_dec.astype(np.float16)
+            arrays['out_b_enc'] = self.output_autoencoder.b_enc.astype(np.float16)
+            arrays['out_b_dec'] = self.output_autoencoder.b_dec.astype(np.float16)
+
+        # StandardScaler state is just four arrays
+        arrays['scaler_mean'] = np.asarray(self.scaler.mean_)
+        arrays['scaler_var'] = np.asarray(self.scaler.var_)
+        arrays['scaler_scale'] = np.asarray(self.scaler.scale_)
+        arrays['scaler_n'] = np.asarray(self.scaler.n_samples_seen_)
+
+        meta = {
+            'version': self.MODEL_VERSION,
             'phase': self.phase,
-            'scaler': self.scaler,
             'feature_groups': self.feature_mapper.feature_groups,
-            'autoencoders': self.autoencoders,
-            'output_autoencoder': self.output_autoencoder,
-            'adaptive_threshold': self.adaptive_threshold,
+            'adaptive_threshold': float(self.adaptive_threshold),
             'training_samples': self.training_samples,
-            'version': '2.0'
+            'num_autoencoders': len(self.autoencoders),
         }
-        
-        with open(self.model_path, 'wb') as f:
-            pickle.dump(model_data, f)
-        
+        arrays['meta'] = np.array(json.dumps(meta))
+
+        np.savez_compressed(self.model_path, **arrays)
+
         logger.info(f"💾 Model saved to {self.model_path}")
-    
+
     def load_model(self):
-        """Load trained model."""
-        with open(self.model_path, 'rb') as f:
-            data = pickle.load(f)
-        
-        # Check version
-        if data.get('version') != '2.0':
-            logger.warning("⚠️ Old model version, retraining recommended")
-        
-        self.phase = data.get('phase', 'DETECT')
-        self.scaler = data['scaler']
-        self.feature_mapper.feature_groups = data['feature_groups']
-        self.feature_mapper.is_ready = True
-        self.autoencoders = data['autoencoders']
-        self.output_autoencoder = data.get('output_autoencoder')
-        self.adaptive_threshold = data.get('adaptive_threshold', 0.95)
-        self.training_samples = data.get('training_samples', 0)
-        self.scaler_fitted = True
-        
+        """Load trained model from the npz archive."""
+        with np.load(self.model_path, allow_pickle=False) as data:
+            meta = json.loads(data['meta'].item())
+
+            # Check version
+            if meta.get('version') != self.MODEL_VERSION:
+                logger.warning("⚠️ Old model version, retraining recommended")
+
+            self.phase = meta.get('phase', 'DETECT')
+            self._impl = self._fm_phase if self.phase == "FM" else (
+                self._ad_phase if self.phase == "AD" else self._detect_phase)
+            self.feature_mapper.feature_groups = meta['feature_groups']
+            self.feature_mapper.is_ready = True
+            self.adaptive_threshold = meta.get('adaptive_threshold', 0.95)
+            self.training_samples = meta.get('training_samples', 0)
+
+            self.scaler = StandardScaler()
+            self.scaler.mean_ = data['scaler_mean']
+            self.scaler.var_ = data['scaler_var']
+            self.scaler.scale_ = data['scaler_scale']
+            self.scaler.n_samples_seen_ = data['scaler_n'][()]
+            self.scaler_fitted = True
+
+            # The gather index pre-bakes the scaler terms, so the scaler
+            # must be restored first
+            self._build_group_index()
+
+            self.autoencoders = []
+            for i in range(meta.get('num_autoencoders', 0)):
+                ae = Autoencoder(input_size=data[f'ae{i}_W_enc'].shape[0])
+                ae.load_weights(data[f'ae{i}_W_enc'], data[f'ae{i}_W_dec'],
+                                data[f'ae{i}_b_enc'], data[f'ae{i}_b_dec'])
+                self.autoencoders.append(ae)
+
+            if 'out_W_enc' in data:
+                self.output_autoencoder = Autoencoder(input_size=data['out_W_enc'].shape[0])
+                self.output_autoencoder.load_weights(data['out_W_enc'], data['out_W_dec'],
+                                                     data['out_b_enc'], data['out_b_dec'])
+            else:
+                self.output_autoencoder = None
+
         logger.info(f"📂 Model loaded: {len(self.autoencoders)} AEs, threshold={self.adaptive_threshold:.4f}")
     
     def get_stats(self) -> dict[str, Any]:
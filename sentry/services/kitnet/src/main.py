@@ -48,7 +48,7 @@ class KitNETService:
         
         # Initialize components
         self.detector = KitNETDetector(
-            model_path=self.data_dir / 'kitnet_model.pkl',
+            model_path=self.data_dir / 'kitnet_model.npz',
             threshold=self.threshold
         )
         self.monitor = NetworkMonitor()
@@ -145,34 +145,10 @@ class KitNETService:
     async def handle_anomaly(self, packet_data: dict, score: float):
         """Handle detected anomaly by alerting Bridge service"""
         logger.warning(f"🚨 Anomaly detected: score={score:.4f}")
-        
-        # Get detector context
-        stats = self.detector.get_stats()
-        
-        alert_data = {
-            "source": "kitnet",
-            "timestamp": packet_data.get("timestamp", datetime.now().isoformat()),
-            "anomaly_score": score,
-            "threshold": self.detector.adaptive_threshold,
-            "network": {
-                "src_ip": packet_data.get("src_ip"),
-                "dest_ip": packet_data.get("dest_ip"),
-                "src_port": packet_data.get("src_port"),
-                "dest_port": packet_data.get("dest_port"),
-                "protocol": packet_data.get("protocol"),
-                "service": packet_data.get("service"),
-                "duration": packet_data.get("duration"),
-            },
-            "context": {
-                "has_dns": bool(packet_data.get("dns_queries")),
-                "has_http": bool(packet_data.get("http_requests")),
-                "has_ssl": bool(packet_data.get("ssl_info")),
-                "num_autoencoders": stats.get("num_autoencoders", 0),
-                "feature_groups": stats.get("feature_groups", 0),
-            }
-        }
-        
-        await self.alert_manager.send_alert(alert_data, packet_data)
+
+        # The detector already holds the score as a float - pass it through
+        # typed; the AlertManager no longer unwraps score dicts
+        await self.alert_manager.send_alert(score, packet_data)
     
     async def report_stats(self):
         """Periodically report stats to Bridge"""
@@ -217,4 +193,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop's C event loop shaves per-task overhead off the packet and
+    # alert fan-out loops; fall back to the stdlib loop if unavailable
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        logger.warning("⚠️ uvloop not available - using default event loop")
+
     asyncio.run(main())
\ No newline at end of file